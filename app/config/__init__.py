@@ -1,4 +1,14 @@
 """Configuration module."""
-from .settings import settings
+from .settings import Settings, get_settings
 
-__all__ = ["settings"]
+# Importing the submodule bound it as ``settings`` on this package; drop that
+# binding so ``settings`` resolves to the instance through __getattr__ below
+del settings
+
+__all__ = ["Settings", "get_settings", "settings"]
+
+def __getattr__(name: str):
+    """Resolve ``settings`` on first access instead of at import time."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
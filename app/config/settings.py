@@ -3,10 +3,97 @@ Configuration settings for the ticketing API.
 Follows Azure best practices for configuration management.
 """
 import os
-from typing import Optional
-from pydantic_settings import BaseSettings
-from azure.identity import DefaultAzureCredential
-from azure.keyvault.secrets import SecretClient
+import asyncio
+import functools
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Union
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+if TYPE_CHECKING:
+    # The Azure SDK is only imported when a Key Vault is actually configured
+    from azure.identity.aio import DefaultAzureCredential
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class _CachedSecret:
+    """A Key Vault secret value and the monotonic time it was fetched."""
+    value: Optional[str]
+    fetched_at: float
+
+# Key Vault secret name -> Settings attribute, loaded if they exist
+_SECRETS_TO_LOAD: Tuple[Tuple[str, str], ...] = (
+    ("openai-api-key", "openai_api_key"),
+    ("database-url", "database_url"),
+    ("secret-key", "secret_key")
+)
+
+# Secrets shared across Settings instances, keyed by (vault_url, secret_name)
+_secret_cache: Dict[Tuple[str, str], _CachedSecret] = {}
+_secret_cache_lock = threading.Lock()
+
+def _kv_credential() -> "DefaultAzureCredential":
+    """Build the async credential used for one batch of Key Vault reads."""
+    from azure.identity.aio import DefaultAzureCredential
+    
+    # Skip chain members this service never uses; each one is a probe or timeout
+    return DefaultAzureCredential(
+        exclude_visual_studio_code_credential=True,
+        exclude_shared_token_cache_credential=True,
+        exclude_powershell_credential=True,
+        exclude_interactive_browser_credential=True
+    )
+
+async def _fetch_secrets(
+    vault_url: str,
+    ttl_seconds: float
+) -> Dict[str, Union[Optional[str], BaseException]]:
+    """
+    Return secret values by name, serving them from memory within the TTL window.
+    
+    Cache misses are fetched concurrently over a single credential and client,
+    so all reads share one token and connection. Failed reads are returned as
+    the raised exception instead of propagating.
+    """
+    now = time.monotonic()
+    results: Dict[str, Union[Optional[str], BaseException]] = {}
+    missing = []
+    
+    with _secret_cache_lock:
+        for secret_name, _ in _SECRETS_TO_LOAD:
+            cached = _secret_cache.get((vault_url, secret_name))
+            if cached is not None and now - cached.fetched_at < ttl_seconds:
+                results[secret_name] = cached.value
+            else:
+                missing.append(secret_name)
+    
+    if not missing:
+        return results
+    
+    from azure.keyvault.secrets.aio import SecretClient
+    
+    async with _kv_credential() as credential, SecretClient(
+        vault_url=vault_url,
+        credential=credential
+    ) as client:
+        fetched = await asyncio.gather(
+            *(client.get_secret(secret_name) for secret_name in missing),
+            return_exceptions=True
+        )
+    
+    with _secret_cache_lock:
+        for secret_name, secret in zip(missing, fetched):
+            if isinstance(secret, BaseException):
+                results[secret_name] = secret
+                continue
+            _secret_cache[(vault_url, secret_name)] = _CachedSecret(value=secret.value, fetched_at=now)
+            results[secret_name] = secret.value
+    
+    return results
 
 class Settings(BaseSettings):
     """Application settings with Azure integration."""
@@ -20,6 +107,8 @@ class Settings(BaseSettings):
     # Server settings
     host: str = "0.0.0.0"
     port: int = 8000
+    # Each worker holds its own in-memory vector store, so keep 1 unless it is externalized
+    workers: int = 1
     
     # Database settings
     database_url: str = "sqlite:///./tickets.db"
@@ -27,11 +116,14 @@ class Settings(BaseSettings):
     # Vector store settings
     vector_db_path: str = "./vector_store"
     embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    # Index existing tickets at startup; reads the whole tickets table once
+    vector_sync_on_startup: bool = False
     
     # Azure settings (following best practices)
     azure_client_id: Optional[str] = None
     azure_tenant_id: Optional[str] = None
     azure_keyvault_url: Optional[str] = None
+    kv_cache_ttl_seconds: int = 600
     
     # AI/ML settings
     openai_api_key: Optional[str] = None
@@ -47,45 +139,45 @@ class Settings(BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
-
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self._load_azure_secrets()
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
     
-    def _load_azure_secrets(self):
-        """Load secrets from Azure Key Vault if configured."""
+    @field_validator("log_level")
+    @classmethod
+    def normalize_log_level(cls, v: str) -> str:
+        """Store the log level upper-cased so callers never re-normalize it."""
+        return v.upper()
+
+    async def load_azure_secrets(self):
+        """
+        Load secrets from Azure Key Vault if configured.
+        
+        Not run on construction so importing the config never blocks on
+        Key Vault; the application lifespan awaits this during startup.
+        """
         if not self.azure_keyvault_url:
             return
         
         try:
-            # Use managed identity for Azure-hosted apps
-            credential = DefaultAzureCredential()
-            client = SecretClient(
-                vault_url=self.azure_keyvault_url,
-                credential=credential
-            )
-            
-            # Load secrets if they exist
-            secrets_to_load = [
-                ("openai-api-key", "openai_api_key"),
-                ("database-url", "database_url"),
-                ("secret-key", "secret_key")
-            ]
-            
-            for secret_name, attr_name in secrets_to_load:
-                try:
-                    secret = client.get_secret(secret_name)
-                    if secret.value:
-                        setattr(self, attr_name, secret.value)
-                except Exception as e:
-                    # Log but don't fail - fall back to env vars
-                    print(f"Warning: Could not load secret {secret_name}: {e}")
-                    
+            values = await _fetch_secrets(self.azure_keyvault_url, self.kv_cache_ttl_seconds)
         except Exception as e:
-            print(f"Warning: Could not connect to Azure Key Vault: {e}")
+            logger.warning("Could not connect to Azure Key Vault: %s", e)
+            return
+        
+        for secret_name, attr_name in _SECRETS_TO_LOAD:
+            value = values.get(secret_name)
+            if isinstance(value, BaseException):
+                # Log but don't fail - fall back to env vars
+                logger.warning("Could not load secret %s: %s", secret_name, value)
+            elif value:
+                setattr(self, attr_name, value)
+
+@functools.cache
+def get_settings() -> Settings:
+    """Return the process-wide settings, building them on first use."""
+    return Settings()
 
-# Global settings instance
-settings = Settings()
+def __getattr__(name: str):
+    """Resolve the legacy module-level ``settings`` lazily."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,32 +3,70 @@ Main FastAPI application for the RAG-based ticketing system with MCP support.
 Follows Azure best practices for API development and error handling.
 """
 import logging
+import queue
+import textwrap
 import time
+import orjson
+from logging.handlers import QueueHandler, QueueListener
 from contextlib import asynccontextmanager
 from typing import Dict, Any
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from fastapi.openapi.docs import get_swagger_ui_html
+from fastapi.responses import ORJSONResponse, Response
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
 
-from .config import settings
+from .config import get_settings
 from .routers import tickets_router, mcp_router
 from .services import ticket_service, vector_store, rag_service
 
-# Configure logging
+# Built at import on purpose: the app title, debug flag, CORS origins and log
+# level below are all fixed when the module loads, and get_settings() caches
+# the instance so the lifespan reuses it rather than parsing the env again
+settings = get_settings()
+
+# Configure logging: records are queued on the event loop and written to
+# stderr by a background listener thread, started and stopped in the lifespan
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+)
+_log_listener = QueueListener(_log_queue, _log_stream_handler, respect_handler_level=True)
+
+# Resolve the configured level once; the request middleware branches on INFO_ON
+LOG_LEVEL_NUM = logging.getLevelName(settings.log_level)
+INFO_ON = LOG_LEVEL_NUM <= logging.INFO
+
+# The queue handler only merges args into the message; the listener's
+# formatter adds the timestamp, logger name and level
+_log_queue_handler = QueueHandler(_log_queue)
+_log_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
 logging.basicConfig(
-    level=getattr(logging, settings.log_level.upper()),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    level=LOG_LEVEL_NUM,
+    handlers=[_log_queue_handler]
 )
 logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan management with proper initialization and cleanup."""
+    _log_listener.start()
     logger.info("Starting up ticketing API with MCP support...")
     
+    settings = get_settings()
+    app.state.settings = settings
+    app.state.kv_loaded = False
+    app.state.initialized = False
+    
     try:
+        # Load Key Vault secrets before services read them
+        if settings.azure_keyvault_url:
+            logger.info("Loading secrets from Azure Key Vault...")
+            await settings.load_azure_secrets()
+        app.state.kv_loaded = True
+        
         # Initialize services with proper error handling
         logger.info("Initializing ticket service...")
         await ticket_service.initialize()
@@ -45,23 +83,26 @@ async def lifespan(app: FastAPI):
         app.state.initialized = True
         app.state.startup_time = time.time()
         
+        # Build and serialize the OpenAPI schema once, before the first request
+        app.state.openapi_bytes = orjson.dumps(app.openapi())
+        app.state.openapi_built_at = time.monotonic()
+        
         yield
         
     except Exception as e:
-        logger.error(f"Failed to initialize services: {e}")
+        logger.error("Failed to initialize services: %s", e)
         app.state.initialized = False
         raise
     
     finally:
         # Cleanup resources
         logger.info("Shutting down ticketing API...")
-        # Add any cleanup logic here if needed
+        await ticket_service.close()
+        _log_listener.stop()
 
-# Create FastAPI application
-app = FastAPI(
-    title=settings.app_name,
-    version=settings.app_version,
-    description="""
+# API description shown in the OpenAPI schema; dedented so Markdown renders
+# headings and lists instead of an indented code block
+_API_DESCRIPTION = textwrap.dedent("""
     RAG-based Ticketing System with Model Context Protocol (MCP) Support
     
     This API provides both traditional REST endpoints and MCP-compatible tools
@@ -84,56 +125,67 @@ app = FastAPI(
     
     This demo version uses basic authentication. In production, integrate with
     Azure AD, managed identities, and proper RBAC.
-    """,
+    """).strip()
+
+# Create FastAPI application
+app = FastAPI(
+    title=settings.app_name,
+    version=settings.app_version,
+    description=_API_DESCRIPTION,
     debug=settings.debug,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    # Served below from the pre-serialized schema
+    openapi_url=None,
+    docs_url=None,
+    redoc_url=None
 )
 
 # Configure CORS with security considerations
+_cors_origins = ("*",) if settings.debug else ("http://localhost:3000", "https://yourdomain.com")
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"] if settings.debug else ["http://localhost:3000", "https://yourdomain.com"],
-    allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
+    allow_origins=_cors_origins,
+    # Browsers reject credentials with a wildcard origin, so only allow them for explicit origins
+    allow_credentials="*" not in _cors_origins,
+    allow_methods=("GET", "POST", "PUT", "DELETE", "OPTIONS"),
+    allow_headers=("authorization", "content-type", "x-request-id"),
 )
 
 # Add request logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all requests with timing information."""
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     # Log request
-    logger.info(f"Request: {request.method} {request.url}")
+    if INFO_ON:
+        logger.info("Request: %s %s", request.method, request.url)
     
-    try:
-        response = await call_next(request)
-        process_time = time.time() - start_time
-        
-        # Log response
+    # Failures propagate to the global exception handler, which logs them once
+    response = await call_next(request)
+    process_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+    
+    # Log response
+    if INFO_ON:
         logger.info(
-            f"Response: {response.status_code} for {request.method} {request.url} "
-            f"in {process_time:.3f}s"
+            "Response: %s for %s %s in %sms",
+            response.status_code, request.method, request.url, process_time_ms
         )
-        
-        # Add timing header
-        response.headers["X-Process-Time"] = str(process_time)
-        
-        return response
-        
-    except Exception as e:
-        process_time = time.time() - start_time
-        logger.error(f"Request failed: {request.method} {request.url} in {process_time:.3f}s - {e}")
-        raise
+    
+    # Add timing header; the value is whole milliseconds (it was float seconds)
+    response.headers["X-Process-Time"] = str(process_time_ms)
+    
+    return response
 
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler with proper logging."""
-    logger.error(f"Unhandled exception for {request.method} {request.url}: {exc}", exc_info=True)
+    logger.exception("Unhandled exception for %s %s", request.method, request.url.path)
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -167,6 +219,63 @@ async def root():
         ]
     }
 
+# Liveness probe: the process is up and serving requests
+@app.get("/health/live", tags=["health"])
+async def health_live():
+    """Liveness probe that never touches downstream services."""
+    return {"status": "alive"}
+
+def _services_healthy(services: Dict[str, Any]) -> bool:
+    """Return True when every reported service status is healthy."""
+    for status in services.values():
+        if isinstance(status, dict):
+            status = status.get("status")
+        if status != "healthy":
+            return False
+    return True
+
+# Readiness probe: secrets are loaded and services are initialized
+@app.get("/health/ready", tags=["health"])
+async def health_ready():
+    """Readiness probe reporting whether startup has completed."""
+    kv_loaded = getattr(app.state, "kv_loaded", False)
+    initialized = getattr(app.state, "initialized", False)
+    
+    services = {}
+    if initialized:
+        services = {
+            "ticket_service": (await ticket_service.healthcheck())["status"],
+            "vector_store": (await vector_store.healthcheck())["status"],
+            "rag_service": (await rag_service.healthcheck())["status"]
+        }
+    
+    ready = kv_loaded and initialized and _services_healthy(services)
+    
+    return ORJSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "starting",
+            "kv_loaded": kv_loaded,
+            "initialized": initialized,
+            "services": services
+        }
+    )
+
+# Probes poll far more often than collection stats change
+VECTOR_STATS_TTL_SECONDS = 5.0
+
+async def _cached_vector_stats() -> Dict[str, Any]:
+    """Return vector store stats, refreshing at most once per TTL window."""
+    cache = getattr(app.state, "vs_stats_cache", None)
+    if cache is None:
+        cache = app.state.vs_stats_cache = {"t": 0.0, "v": None}
+    
+    now = time.monotonic()
+    if cache["v"] is None or now - cache["t"] >= VECTOR_STATS_TTL_SECONDS:
+        cache["v"] = await vector_store.get_collection_stats()
+        cache["t"] = now
+    return cache["v"]
+
 # Health check endpoint
 @app.get("/health", tags=["health"])
 async def health_check():
@@ -174,7 +283,7 @@ async def health_check():
     try:
         # Check if app was initialized properly
         if not getattr(app.state, "initialized", False):
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=503,
                 content={
                     "status": "unhealthy",
@@ -193,42 +302,42 @@ async def health_check():
         
         # Check ticket service
         try:
-            await ticket_service.initialize()
-            health_status["services"]["ticket_service"] = "healthy"
+            ticket_health = await ticket_service.healthcheck()
+            health_status["services"]["ticket_service"] = ticket_health["status"]
         except Exception as e:
             health_status["services"]["ticket_service"] = f"unhealthy: {e}"
-            health_status["status"] = "degraded"
         
         # Check vector store
         try:
-            await vector_store.initialize()
-            vector_stats = await vector_store.get_collection_stats()
+            vector_health = await vector_store.healthcheck()
+            vector_stats = await _cached_vector_stats()
             health_status["services"]["vector_store"] = {
-                "status": "healthy",
+                "status": vector_health["status"],
                 "stats": vector_stats
             }
         except Exception as e:
             health_status["services"]["vector_store"] = f"unhealthy: {e}"
-            health_status["status"] = "degraded"
         
         # Check RAG service
         try:
-            await rag_service.initialize()
-            health_status["services"]["rag_service"] = "healthy"
+            rag_health = await rag_service.healthcheck()
+            health_status["services"]["rag_service"] = rag_health["status"]
         except Exception as e:
             health_status["services"]["rag_service"] = f"unhealthy: {e}"
+        
+        if not _services_healthy(health_status["services"]):
             health_status["status"] = "degraded"
         
         status_code = 200 if health_status["status"] == "healthy" else 503
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status_code,
             content=health_status
         )
         
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        return JSONResponse(
+        logger.error("Health check failed: %s", e)
+        return ORJSONResponse(
             status_code=503,
             content={
                 "status": "unhealthy",
@@ -246,7 +355,7 @@ def custom_openapi():
     openapi_schema = get_openapi(
         title=settings.app_name,
         version=settings.app_version,
-        description=app.description,
+        description=_API_DESCRIPTION,
         routes=app.routes,
     )
     
@@ -283,10 +392,31 @@ def custom_openapi():
 
 app.openapi = custom_openapi
 
+@app.get("/openapi.json", include_in_schema=False)
+async def openapi_json():
+    """Serve the OpenAPI schema from bytes cached at startup."""
+    openapi_bytes = getattr(app.state, "openapi_bytes", None)
+    if openapi_bytes is None:
+        openapi_bytes = orjson.dumps(app.openapi())
+        app.state.openapi_bytes = openapi_bytes
+    return Response(content=openapi_bytes, media_type="application/json")
+
+@app.get("/docs", include_in_schema=False)
+async def swagger_ui():
+    """Swagger UI backed by the cached OpenAPI schema."""
+    return get_swagger_ui_html(openapi_url="/openapi.json", title=f"{settings.app_name} - Swagger UI")
+
+@app.get("/redoc", include_in_schema=False)
+async def redoc_ui():
+    """ReDoc UI backed by the cached OpenAPI schema."""
+    return get_redoc_html(openapi_url="/openapi.json", title=f"{settings.app_name} - ReDoc")
+
 # Application entry point
 if __name__ == "__main__":
     import uvicorn
     
+    # Root logging was configured by this module, so drain its queue here too
+    _log_listener.start()
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
     logger.info(f"Environment: {'DEBUG' if settings.debug else 'PRODUCTION'}")
     
@@ -295,6 +425,13 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
-        log_level=settings.log_level.lower(),
-        access_log=True
+        # --reload and multiple workers are mutually exclusive in uvicorn
+        workers=1 if settings.debug else settings.workers,
+        # "auto" selects uvloop/httptools when installed (uvicorn[standard])
+        loop="auto",
+        http="auto",
+        log_level=LOG_LEVEL_NUM,
+        # Requests are already logged by the log_requests middleware
+        access_log=False
     )
+    _log_listener.stop()
@@ -2,9 +2,10 @@
 MCP (Model Context Protocol) Server implementation.
 Exposes ticket management tools following MCP pattern for Semantic Kernel integration.
 """
+import asyncio
 import logging
 import json
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Literal, Optional, Callable, TypedDict, Union
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -13,20 +14,472 @@ from .models.mcp_models import (
     MCPListToolsResponse, MCPToolCall, MCPToolResponse
 )
 from .models.ticket import (
-    TicketCreate, TicketUpdate, TicketSearchRequest, TicketStatus,
-    TicketPriority, TicketCategory, MCPTicketResponse, MCPTicketListResponse
+    Ticket, TicketCreate, TicketUpdate, TicketSearchRequest, TicketStatus,
+    TicketPriority, TicketCategory, MCPTicketResponse, MCPTicketListResponse,
+    STATUS_TO_STR
 )
 from .services import ticket_service, rag_service
 
 logger = logging.getLogger(__name__)
 
+# Required keys live in the base classes; total=False subclasses add the
+# optional ones (NotRequired needs Python 3.11)
+class _ToolSuccessBase(TypedDict):
+    """Keys present on every successful tool result."""
+    success: Literal[True]
+    message: str
+
+class ToolSuccess(_ToolSuccessBase, total=False):
+    """Successful tool result."""
+    data: Dict[str, Any]
+    tickets: List[Dict[str, Any]]
+    total_count: int
+    search_time_ms: float
+
+class _ToolErrorBase(TypedDict):
+    """Keys present on every failed tool result."""
+    success: Literal[False]
+    error: str
+
+class ToolError(_ToolErrorBase, total=False):
+    """Failed tool result."""
+    tickets: List[Dict[str, Any]]
+    total_count: int
+
+ToolResult = Union[ToolSuccess, ToolError]
+
+# Enum lookups built once so tool calls coerce strings with a dict hit
+STATUS_VALUES = tuple(s.value for s in TicketStatus)
+STATUS_LOOKUP = {s.value: s for s in TicketStatus}
+PRIORITY_VALUES = tuple(p.value for p in TicketPriority)
+PRIORITY_LOOKUP = {p.value: p for p in TicketPriority}
+CATEGORY_VALUES = tuple(c.value for c in TicketCategory)
+CATEGORY_LOOKUP = {c.value: c for c in TicketCategory}
+
+_STATUS_CHOICES = f"Must be one of: {list(STATUS_VALUES)}"
+_PRIORITY_CHOICES = f"Must be one of: {list(PRIORITY_VALUES)}"
+_CATEGORY_CHOICES = f"Must be one of: {list(CATEGORY_VALUES)}"
+
+# Fields exposed by each tool response, dumped by pydantic in JSON mode
+_LIST_FIELDS = frozenset({
+    "id", "title", "description", "status", "priority", "category",
+    "assignee", "reporter", "created_at", "tags"
+})
+_SEARCH_FIELDS = frozenset({"id", "title", "description", "status", "priority", "category"})
+_UPDATE_FIELDS = frozenset({"id", "title", "status", "updated_at"})
+
+def _coerce(lookup: Dict[str, Any], value: str) -> Any:
+    """Map a case-insensitive string to its enum member, or None if invalid."""
+    # Callers usually send lowercase already, so skip allocating a lowered copy
+    return lookup.get(value) if value.islower() else lookup.get(value.lower())
+
+def _error(message: str) -> ToolError:
+    """Build a failed tool response."""
+    return {"success": False, "error": message}
+
+# Messages for fixed failures; each response is built fresh so callers may mutate it
+_NO_UPDATE_FIELDS = "No fields to update provided"
+_NO_TICKETS_FOR_ANALYSIS = "No tickets found for analysis"
+_INSIGHTS_UNAVAILABLE = "Unable to generate insights (AI service may be unavailable)"
+_EMPTY_QUERY = "Search query cannot be empty"
+_INVALID_SEARCH_LIMIT = "Limit must be between 1 and 100"
+
+def _truncate(text: str, limit: int = 200) -> str:
+    """Shorten text to limit characters for list previews."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+def _ticket_preview(ticket: Ticket, fields: frozenset) -> Dict[str, Any]:
+    """Dump the given ticket fields with a truncated description."""
+    data = ticket.model_dump(mode="json", include=fields)
+    data["description"] = _truncate(data["description"])
+    return data
+
+class GetTicketCoalescer:
+    """Coalesce concurrent get_ticket lookups into batched IN queries."""
+    
+    def __init__(self, window_seconds: float = 0.002, max_batch: int = 32):
+        """Initialize the coalescer with its batching window and size."""
+        self.window_seconds = window_seconds
+        self.max_batch = max_batch
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: set = set()
+    
+    async def get(self, ticket_id: int) -> Optional[Ticket]:
+        """Get a ticket, sharing one query with other in-flight lookups."""
+        future = self._pending.get(ticket_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[ticket_id] = future
+            
+            if len(self._pending) >= self.max_batch:
+                self._start_flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window_seconds, self._start_flush)
+        
+        # Shield so one cancelled caller does not cancel the shared result
+        return await asyncio.shield(future)
+    
+    def _start_flush(self):
+        """Hand the current batch to a background fetch task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.ensure_future(self._flush(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+    
+    async def _flush(self, batch: Dict[int, asyncio.Future]):
+        """Fetch a batch of tickets and resolve the waiting futures."""
+        try:
+            tickets = await ticket_service.get_tickets_by_ids(list(batch))
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for ticket_id, future in batch.items():
+            if not future.done():
+                future.set_result(tickets.get(ticket_id))
+
+# Shared coalescer for get_ticket tool calls
+ticket_coalescer = GetTicketCoalescer()
+
+async def _tool_create_ticket(
+    title: str,
+    description: str,
+    priority: str = "medium",
+    category: str = "other",
+    assignee: Optional[str] = None,
+    reporter: str = "",
+    tags: Optional[List[str]] = None
+) -> ToolResult:
+    """Create a new incident ticket."""
+    try:
+        # Validate enums
+        priority_enum = _coerce(PRIORITY_LOOKUP, priority)
+        if priority_enum is None:
+            return _error(f"Invalid priority: {priority}. {_PRIORITY_CHOICES}")
+        
+        category_enum = _coerce(CATEGORY_LOOKUP, category)
+        if category_enum is None:
+            return _error(f"Invalid category: {category}. {_CATEGORY_CHOICES}")
+        
+        # Create ticket
+        ticket_data = TicketCreate(
+            title=title,
+            description=description,
+            priority=priority_enum,
+            category=category_enum,
+            assignee=assignee,
+            reporter=reporter,
+            tags=tags
+        )
+        
+        ticket = await ticket_service.create_ticket(ticket_data)
+        
+        return {
+            "success": True,
+            "message": f"Ticket created successfully with ID {ticket.id}",
+            "data": {
+                "ticket_id": ticket.id,
+                "title": ticket.title,
+                "status": STATUS_TO_STR[ticket.status],
+                "created_at": ticket.created_at.isoformat()
+            }
+        }
+        
+    except Exception as e:
+        logger.error("Error creating ticket: %s", e)
+        return _error(str(e))
+
+async def _tool_list_tickets(
+    status: Optional[List[str]] = None,
+    priority: Optional[List[str]] = None,
+    category: Optional[List[str]] = None,
+    assignee: Optional[str] = None,
+    reporter: Optional[str] = None,
+    limit: int = 10
+) -> ToolResult:
+    """List tickets with optional filtering."""
+    try:
+        # Fast path for the common unfiltered "recent tickets" listing
+        if not (status or priority or category or assignee or reporter):
+            tickets = await ticket_service.list_recent(limit)
+            return {
+                "success": True,
+                "message": f"Found {len(tickets)} tickets",
+                "tickets": [_ticket_preview(ticket, _LIST_FIELDS) for ticket in tickets],
+                "total_count": len(tickets)
+            }
+        
+        # Convert string enums to enum objects in one pass over the filters
+        filters: Dict[str, Optional[List[Any]]] = {}
+        for name, values, lookup, choices in (
+            ("status", status, STATUS_LOOKUP, _STATUS_CHOICES),
+            ("priority", priority, PRIORITY_LOOKUP, _PRIORITY_CHOICES),
+            ("category", category, CATEGORY_LOOKUP, _CATEGORY_CHOICES)
+        ):
+            enums = None
+            if values:
+                enums = []
+                for value in values:
+                    enum = _coerce(lookup, value)
+                    if enum is None:
+                        return _error(f"Invalid {name} value: {value}. {choices}")
+                    enums.append(enum)
+            filters[name] = enums
+        
+        # Fetch tickets
+        tickets = await ticket_service.list_tickets(
+            limit=limit,
+            status=filters["status"],
+            priority=filters["priority"],
+            category=filters["category"],
+            assignee=assignee,
+            reporter=reporter
+        )
+        
+        # Convert to serializable format
+        ticket_data = [_ticket_preview(ticket, _LIST_FIELDS) for ticket in tickets]
+        
+        return {
+            "success": True,
+            "message": f"Found {len(tickets)} tickets",
+            "tickets": ticket_data,
+            "total_count": len(tickets)
+        }
+        
+    except Exception as e:
+        logger.error("Error listing tickets: %s", e)
+        return {
+            "success": False,
+            "error": str(e),
+            "tickets": [],
+            "total_count": 0
+        }
+
+async def _tool_get_ticket(
+    ticket_id: int,
+    include_ai_insights: bool = False
+) -> ToolResult:
+    """Get detailed information about a specific ticket."""
+    try:
+        if include_ai_insights:
+            ticket_data = await ticket_service.get_ticket_with_ai_insights(ticket_id)
+            if not ticket_data:
+                return _error(f"Ticket {ticket_id} not found")
+            
+            return {
+                "success": True,
+                "message": f"Retrieved ticket {ticket_id} with AI insights",
+                "data": ticket_data
+            }
+        else:
+            # Serve cached tickets without a round trip through the coalescer
+            ticket = ticket_service.get_ticket_cached_sync(ticket_id)
+            if ticket is None:
+                ticket = await ticket_coalescer.get(ticket_id)
+            if not ticket:
+                return _error(f"Ticket {ticket_id} not found")
+            
+            return {
+                "success": True,
+                "message": f"Retrieved ticket {ticket_id}",
+                "data": ticket.model_dump(mode="json")
+            }
+        
+    except Exception as e:
+        logger.error("Error getting ticket %s: %s", ticket_id, e)
+        return _error(str(e))
+
+async def _tool_update_ticket(
+    ticket_id: int,
+    title: Optional[str] = None,
+    description: Optional[str] = None,
+    status: Optional[str] = None,
+    priority: Optional[str] = None,
+    category: Optional[str] = None,
+    assignee: Optional[str] = None,
+    resolution_notes: Optional[str] = None,
+    tags: Optional[List[str]] = None
+) -> ToolResult:
+    """Update an existing ticket."""
+    try:
+        # Build update data
+        update_data = {}
+        
+        if title is not None:
+            update_data["title"] = title
+        if description is not None:
+            update_data["description"] = description
+        if status is not None:
+            status_enum = _coerce(STATUS_LOOKUP, status)
+            if status_enum is None:
+                return _error(f"Invalid status: {status}. {_STATUS_CHOICES}")
+            update_data["status"] = status_enum
+        if priority is not None:
+            priority_enum = _coerce(PRIORITY_LOOKUP, priority)
+            if priority_enum is None:
+                return _error(f"Invalid priority: {priority}. {_PRIORITY_CHOICES}")
+            update_data["priority"] = priority_enum
+        if category is not None:
+            category_enum = _coerce(CATEGORY_LOOKUP, category)
+            if category_enum is None:
+                return _error(f"Invalid category: {category}. {_CATEGORY_CHOICES}")
+            update_data["category"] = category_enum
+        if assignee is not None:
+            update_data["assignee"] = assignee
+        if resolution_notes is not None:
+            update_data["resolution_notes"] = resolution_notes
+        if tags is not None:
+            update_data["tags"] = tags
+        
+        if not update_data:
+            return _error(_NO_UPDATE_FIELDS)
+        
+        # Update ticket
+        ticket_update = TicketUpdate(**update_data)
+        ticket = await ticket_service.update_ticket(ticket_id, ticket_update)
+        
+        if not ticket:
+            return _error(f"Ticket {ticket_id} not found")
+        
+        return {
+            "success": True,
+            "message": f"Ticket {ticket_id} updated successfully",
+            "data": ticket.model_dump(mode="json", include=_UPDATE_FIELDS)
+        }
+        
+    except Exception as e:
+        logger.error("Error updating ticket %s: %s", ticket_id, e)
+        return _error(str(e))
+
+async def _tool_search_tickets(
+    query: str,
+    limit: int = 10,
+    use_semantic_search: bool = True
+) -> ToolResult:
+    """Search tickets using semantic search and RAG."""
+    try:
+        # Check the two constrained fields directly instead of re-validating the model
+        if not query:
+            return _error(_EMPTY_QUERY)
+        if not 1 <= limit <= 100:
+            return _error(_INVALID_SEARCH_LIMIT)
+        
+        search_request = TicketSearchRequest.model_construct(
+            query=query,
+            limit=limit,
+            use_semantic_search=use_semantic_search
+        )
+        
+        results = await ticket_service.search_tickets(search_request)
+        
+        # Convert tickets to serializable format
+        similarity_scores = results["similarity_scores"]
+        ticket_data = []
+        for ticket in results["tickets"]:
+            ticket_dict = _ticket_preview(ticket, _SEARCH_FIELDS)
+            ticket_dict["similarity_score"] = similarity_scores.get(ticket.id, 0.0)
+            ticket_data.append(ticket_dict)
+        
+        return {
+            "success": True,
+            "message": f"Found {len(ticket_data)} tickets matching '{query}'",
+            "tickets": ticket_data,
+            "total_count": results["total_count"],
+            "search_time_ms": results["search_time_ms"]
+        }
+        
+    except Exception as e:
+        logger.error("Error searching tickets: %s", e)
+        return {
+            "success": False,
+            "error": str(e),
+            "tickets": [],
+            "total_count": 0
+        }
+
+async def _tool_get_ticket_analytics() -> ToolResult:
+    """Get ticket statistics and analytics."""
+    try:
+        analytics = await ticket_service.get_ticket_analytics()
+        
+        return {
+            "success": True,
+            "message": "Analytics retrieved successfully",
+            "data": {
+                "total_tickets": analytics.total_tickets,
+                "open_tickets": analytics.open_tickets,
+                "closed_tickets": analytics.closed_tickets,
+                "avg_resolution_time_hours": analytics.avg_resolution_time_hours,
+                "tickets_by_status": analytics.tickets_by_status,
+                "tickets_by_priority": analytics.tickets_by_priority,
+                "tickets_by_category": analytics.tickets_by_category,
+                "recent_activity": analytics.recent_activity
+            }
+        }
+        
+    except Exception as e:
+        logger.error("Error getting ticket analytics: %s", e)
+        return _error(str(e))
+
+async def _tool_generate_ticket_insights(
+    ticket_ids: Optional[List[int]] = None,
+    limit: int = 50
+) -> ToolResult:
+    """Generate AI-powered insights from ticket data."""
+    try:
+        if ticket_ids:
+            # Get specific tickets in a single query, keeping request order
+            ticket_map = await ticket_service.get_tickets_by_ids(ticket_ids)
+            tickets = [ticket_map[tid] for tid in ticket_ids if tid in ticket_map]
+        else:
+            # Get recent tickets
+            tickets = await ticket_service.list_recent(limit)
+        
+        if not tickets:
+            return _error(_NO_TICKETS_FOR_ANALYSIS)
+        
+        # Generate insights using RAG service
+        insights = await rag_service.generate_ticket_insights(tickets)
+        
+        if not insights:
+            return _error(_INSIGHTS_UNAVAILABLE)
+        
+        return {
+            "success": True,
+            "message": f"Generated insights for {len(tickets)} tickets",
+            "data": insights
+        }
+        
+    except Exception as e:
+        logger.error("Error generating ticket insights: %s", e)
+        return _error(str(e))
+
+# Registered MCP tools by name
+_TOOL_REGISTRY: Dict[str, Callable] = {
+    "create_ticket": _tool_create_ticket,
+    "list_tickets": _tool_list_tickets,
+    "get_ticket": _tool_get_ticket,
+    "update_ticket": _tool_update_ticket,
+    "search_tickets": _tool_search_tickets,
+    "get_ticket_analytics": _tool_get_ticket_analytics,
+    "generate_ticket_insights": _tool_generate_ticket_insights
+}
+
 class SimpleMCPServer:
     """Simple MCP Server for ticket management tools without external dependencies."""
     
     def __init__(self):
         """Initialize the MCP server."""
-        self.tools: Dict[str, Callable] = {}
-        self._register_tools()
+        self.tools: Dict[str, Callable] = dict(_TOOL_REGISTRY)
     
     def tool(self, name: str = None):
         """Decorator to register MCP tools."""
@@ -36,434 +489,17 @@ class SimpleMCPServer:
             return func
         return decorator
     
-    def _register_tools(self):
-        """Register all MCP tools."""
-        
-        @self.tool("create_ticket")
-        async def create_ticket(
-            title: str,
-            description: str,
-            priority: str = "medium",
-            category: str = "other",
-            assignee: Optional[str] = None,
-            reporter: str = "",
-            tags: Optional[List[str]] = None
-        ) -> Dict[str, Any]:
-            """Create a new incident ticket."""
-            try:
-                # Validate enums
-                try:
-                    priority_enum = TicketPriority(priority.lower())
-                except ValueError:
-                    return {
-                        "success": False,
-                        "error": f"Invalid priority: {priority}. Must be one of: {[p.value for p in TicketPriority]}"
-                    }
-                
-                try:
-                    category_enum = TicketCategory(category.lower())
-                except ValueError:
-                    return {
-                        "success": False,
-                        "error": f"Invalid category: {category}. Must be one of: {[c.value for c in TicketCategory]}"
-                    }
-                
-                # Create ticket
-                ticket_data = TicketCreate(
-                    title=title,
-                    description=description,
-                    priority=priority_enum,
-                    category=category_enum,
-                    assignee=assignee,
-                    reporter=reporter,
-                    tags=tags
-                )
-                
-                ticket = await ticket_service.create_ticket(ticket_data)
-                
-                return {
-                    "success": True,
-                    "message": f"Ticket created successfully with ID {ticket.id}",
-                    "data": {
-                        "ticket_id": ticket.id,
-                        "title": ticket.title,
-                        "status": ticket.status.value,
-                        "created_at": ticket.created_at.isoformat()
-                    }
-                }
-                
-            except Exception as e:
-                logger.error(f"Error creating ticket: {e}")
-                return {
-                    "success": False,
-                    "error": str(e)
-                }
-        
-        @self.tool("list_tickets")
-        async def list_tickets(
-            status: Optional[List[str]] = None,
-            priority: Optional[List[str]] = None,
-            category: Optional[List[str]] = None,
-            assignee: Optional[str] = None,
-            reporter: Optional[str] = None,
-            limit: int = 10
-        ) -> Dict[str, Any]:
-            """List tickets with optional filtering."""
-            try:
-                # Convert string enums to enum objects
-                status_enums = None
-                if status:
-                    try:
-                        status_enums = [TicketStatus(s.lower()) for s in status]
-                    except ValueError as e:
-                        return {
-                            "success": False,
-                            "error": f"Invalid status value: {e}"
-                        }
-                
-                priority_enums = None
-                if priority:
-                    try:
-                        priority_enums = [TicketPriority(p.lower()) for p in priority]
-                    except ValueError as e:
-                        return {
-                            "success": False,
-                            "error": f"Invalid priority value: {e}"
-                        }
-                
-                category_enums = None
-                if category:
-                    try:
-                        category_enums = [TicketCategory(c.lower()) for c in category]
-                    except ValueError as e:
-                        return {
-                            "success": False,
-                            "error": f"Invalid category value: {e}"
-                        }
-                
-                # Fetch tickets
-                tickets = await ticket_service.list_tickets(
-                    limit=limit,
-                    status=status_enums,
-                    priority=priority_enums,
-                    category=category_enums,
-                    assignee=assignee,
-                    reporter=reporter
-                )
-                
-                # Convert to serializable format
-                ticket_data = []
-                for ticket in tickets:
-                    ticket_dict = {
-                        "id": ticket.id,
-                        "title": ticket.title,
-                        "description": ticket.description[:200] + "..." if len(ticket.description) > 200 else ticket.description,
-                        "status": ticket.status.value,
-                        "priority": ticket.priority.value,
-                        "category": ticket.category.value,
-                        "assignee": ticket.assignee,
-                        "reporter": ticket.reporter,
-                        "created_at": ticket.created_at.isoformat(),
-                        "tags": ticket.tags
-                    }
-                    ticket_data.append(ticket_dict)
-                
-                return {
-                    "success": True,
-                    "message": f"Found {len(tickets)} tickets",
-                    "tickets": ticket_data,
-                    "total_count": len(tickets)
-                }
-                
-            except Exception as e:
-                logger.error(f"Error listing tickets: {e}")
-                return {
-                    "success": False,
-                    "error": str(e),
-                    "tickets": [],
-                    "total_count": 0
-                }
-        
-        @self.tool("get_ticket")
-        async def get_ticket(
-            ticket_id: int,
-            include_ai_insights: bool = False
-        ) -> Dict[str, Any]:
-            """Get detailed information about a specific ticket."""
-            try:
-                if include_ai_insights:
-                    ticket_data = await ticket_service.get_ticket_with_ai_insights(ticket_id)
-                    if not ticket_data:
-                        return {
-                            "success": False,
-                            "error": f"Ticket {ticket_id} not found"
-                        }
-                    
-                    return {
-                        "success": True,
-                        "message": f"Retrieved ticket {ticket_id} with AI insights",
-                        "data": ticket_data
-                    }
-                else:
-                    ticket = await ticket_service.get_ticket(ticket_id)
-                    if not ticket:
-                        return {
-                            "success": False,
-                            "error": f"Ticket {ticket_id} not found"
-                        }
-                    
-                    return {
-                        "success": True,
-                        "message": f"Retrieved ticket {ticket_id}",
-                        "data": {
-                            "id": ticket.id,
-                            "title": ticket.title,
-                            "description": ticket.description,
-                            "status": ticket.status.value,
-                            "priority": ticket.priority.value,
-                            "category": ticket.category.value,
-                            "assignee": ticket.assignee,
-                            "reporter": ticket.reporter,
-                            "created_at": ticket.created_at.isoformat(),
-                            "updated_at": ticket.updated_at.isoformat() if ticket.updated_at else None,
-                            "resolved_at": ticket.resolved_at.isoformat() if ticket.resolved_at else None,
-                            "tags": ticket.tags,
-                            "resolution_notes": ticket.resolution_notes
-                        }
-                    }
-                
-            except Exception as e:
-                logger.error(f"Error getting ticket {ticket_id}: {e}")
-                return {
-                    "success": False,
-                    "error": str(e)
-                }
-        
-        @self.tool("update_ticket")
-        async def update_ticket(
-            ticket_id: int,
-            title: Optional[str] = None,
-            description: Optional[str] = None,
-            status: Optional[str] = None,
-            priority: Optional[str] = None,
-            category: Optional[str] = None,
-            assignee: Optional[str] = None,
-            resolution_notes: Optional[str] = None,
-            tags: Optional[List[str]] = None
-        ) -> Dict[str, Any]:
-            """Update an existing ticket."""
-            try:
-                # Build update data
-                update_data = {}
-                
-                if title is not None:
-                    update_data["title"] = title
-                if description is not None:
-                    update_data["description"] = description
-                if status is not None:
-                    try:
-                        update_data["status"] = TicketStatus(status.lower())
-                    except ValueError:
-                        return {
-                            "success": False,
-                            "error": f"Invalid status: {status}"
-                        }
-                if priority is not None:
-                    try:
-                        update_data["priority"] = TicketPriority(priority.lower())
-                    except ValueError:
-                        return {
-                            "success": False,
-                            "error": f"Invalid priority: {priority}"
-                        }
-                if category is not None:
-                    try:
-                        update_data["category"] = TicketCategory(category.lower())
-                    except ValueError:
-                        return {
-                            "success": False,
-                            "error": f"Invalid category: {category}"
-                        }
-                if assignee is not None:
-                    update_data["assignee"] = assignee
-                if resolution_notes is not None:
-                    update_data["resolution_notes"] = resolution_notes
-                if tags is not None:
-                    update_data["tags"] = tags
-                
-                if not update_data:
-                    return {
-                        "success": False,
-                        "error": "No fields to update provided"
-                    }
-                
-                # Update ticket
-                ticket_update = TicketUpdate(**update_data)
-                ticket = await ticket_service.update_ticket(ticket_id, ticket_update)
-                
-                if not ticket:
-                    return {
-                        "success": False,
-                        "error": f"Ticket {ticket_id} not found"
-                    }
-                
-                return {
-                    "success": True,
-                    "message": f"Ticket {ticket_id} updated successfully",
-                    "data": {
-                        "id": ticket.id,
-                        "title": ticket.title,
-                        "status": ticket.status.value,
-                        "updated_at": ticket.updated_at.isoformat() if ticket.updated_at else None
-                    }
-                }
-                
-            except Exception as e:
-                logger.error(f"Error updating ticket {ticket_id}: {e}")
-                return {
-                    "success": False,
-                    "error": str(e)
-                }
-        
-        @self.tool("search_tickets")
-        async def search_tickets(
-            query: str,
-            limit: int = 10,
-            use_semantic_search: bool = True
-        ) -> Dict[str, Any]:
-            """Search tickets using semantic search and RAG."""
-            try:
-                search_request = TicketSearchRequest(
-                    query=query,
-                    limit=limit,
-                    use_semantic_search=use_semantic_search
-                )
-                
-                results = await ticket_service.search_tickets(search_request)
-                
-                # Convert tickets to serializable format
-                ticket_data = []
-                for ticket in results["tickets"]:
-                    ticket_dict = {
-                        "id": ticket.id,
-                        "title": ticket.title,
-                        "description": ticket.description[:200] + "..." if len(ticket.description) > 200 else ticket.description,
-                        "status": ticket.status.value,
-                        "priority": ticket.priority.value,
-                        "category": ticket.category.value,
-                        "similarity_score": results["similarity_scores"].get(ticket.id, 0.0)
-                    }
-                    ticket_data.append(ticket_dict)
-                
-                return {
-                    "success": True,
-                    "message": f"Found {len(ticket_data)} tickets matching '{query}'",
-                    "tickets": ticket_data,
-                    "total_count": results["total_count"],
-                    "search_time_ms": results["search_time_ms"]
-                }
-                
-            except Exception as e:
-                logger.error(f"Error searching tickets: {e}")
-                return {
-                    "success": False,
-                    "error": str(e),
-                    "tickets": [],
-                    "total_count": 0
-                }
-        
-        @self.tool("get_ticket_analytics")
-        async def get_ticket_analytics() -> Dict[str, Any]:
-            """Get ticket statistics and analytics."""
-            try:
-                analytics = await ticket_service.get_ticket_analytics()
-                
-                return {
-                    "success": True,
-                    "message": "Analytics retrieved successfully",
-                    "data": {
-                        "total_tickets": analytics.total_tickets,
-                        "open_tickets": analytics.open_tickets,
-                        "closed_tickets": analytics.closed_tickets,
-                        "avg_resolution_time_hours": analytics.avg_resolution_time_hours,
-                        "tickets_by_status": analytics.tickets_by_status,
-                        "tickets_by_priority": analytics.tickets_by_priority,
-                        "tickets_by_category": analytics.tickets_by_category,
-                        "recent_activity": analytics.recent_activity
-                    }
-                }
-                
-            except Exception as e:
-                logger.error(f"Error getting ticket analytics: {e}")
-                return {
-                    "success": False,
-                    "error": str(e)
-                }
-        
-        @self.tool("generate_ticket_insights")
-        async def generate_ticket_insights(
-            ticket_ids: Optional[List[int]] = None,
-            limit: int = 50
-        ) -> Dict[str, Any]:
-            """Generate AI-powered insights from ticket data."""
-            try:
-                if ticket_ids:
-                    # Get specific tickets
-                    tickets = []
-                    for ticket_id in ticket_ids:
-                        ticket = await ticket_service.get_ticket(ticket_id)
-                        if ticket:
-                            tickets.append(ticket)
-                else:
-                    # Get recent tickets
-                    tickets = await ticket_service.list_tickets(limit=limit)
-                
-                if not tickets:
-                    return {
-                        "success": False,
-                        "error": "No tickets found for analysis"
-                    }
-                
-                # Generate insights using RAG service
-                insights = await rag_service.generate_ticket_insights(tickets)
-                
-                if not insights:
-                    return {
-                        "success": False,
-                        "error": "Unable to generate insights (AI service may be unavailable)"
-                    }
-                
-                return {
-                    "success": True,
-                    "message": f"Generated insights for {len(tickets)} tickets",
-                    "data": insights
-                }
-                
-            except Exception as e:
-                logger.error(f"Error generating ticket insights: {e}")
-                return {
-                    "success": False,
-                    "error": str(e)
-                }
-    
-    async def call_tool(self, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    async def call_tool(self, tool_name: str, parameters: Dict[str, Any]) -> ToolResult:
         """Call a registered tool."""
-        if tool_name not in self.tools:
-            return {
-                "success": False,
-                "error": f"Tool '{tool_name}' not found"
-            }
+        tool_func = self.tools.get(tool_name)
+        if tool_func is None:
+            return _error(f"Tool '{tool_name}' not found")
         
         try:
-            tool_func = self.tools[tool_name]
-            result = await tool_func(**parameters)
-            return result
+            return await tool_func(**parameters)
         except Exception as e:
-            logger.error(f"Error calling tool {tool_name}: {e}")
-            return {
-                "success": False,
-                "error": str(e)
-            }
+            logger.error("Error calling tool %s: %s", tool_name, e)
+            return _error(str(e))
 
 # Global MCP server instance
 mcp_server = SimpleMCPServer()
@@ -33,6 +33,7 @@ class MCPToolCall(BaseModel):
     """MCP tool call request."""
     tool_name: str = Field(..., description="Name of the tool to call")
     parameters: Dict[str, Any] = Field(default_factory=dict, description="Tool parameters")
+    measure_time: bool = Field(default=False, description="Report execution_time_ms in the response")
 
 class MCPToolResponse(BaseModel):
     """MCP tool call response."""
@@ -56,9 +57,15 @@ class MCPServerInfo(BaseModel):
     tools: List[MCPTool]
     prompts: List[MCPPrompt]
 
+class MCPToolSummary(BaseModel):
+    """Compact MCP tool listing entry; full schema is served per tool."""
+    name: str
+    description: str
+    param_count: int
+
 class MCPListToolsResponse(BaseModel):
     """Response for listing MCP tools."""
-    tools: List[MCPTool]
+    tools: List[MCPToolSummary]
 
 class MCPListPromptsResponse(BaseModel):
     """Response for listing MCP prompts."""
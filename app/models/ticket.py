@@ -5,7 +5,7 @@ Follows Azure development best practices for data modeling.
 from datetime import datetime
 from enum import Enum
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, validator
 from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLEnum
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
@@ -37,6 +37,11 @@ class TicketCategory(str, Enum):
     SECURITY = "security"
     OTHER = "other"
 
+# Enum member -> plain string tables for serialization hot paths
+STATUS_TO_STR = {m: m.value for m in TicketStatus}
+PRIORITY_TO_STR = {m: m.value for m in TicketPriority}
+CATEGORY_TO_STR = {m: m.value for m in TicketCategory}
+
 # SQLAlchemy ORM Model
 class TicketORM(Base):
     """SQLAlchemy ORM model for tickets."""
@@ -103,8 +108,7 @@ class Ticket(TicketBase):
     resolved_at: Optional[datetime] = None
     resolution_notes: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class TicketSearchRequest(BaseModel):
     """Model for ticket search requests."""
@@ -2,170 +2,212 @@
 MCP API router for Model Context Protocol endpoints.
 Exposes MCP tools and prompts for Semantic Kernel integration.
 """
+import functools
+import hashlib
 import logging
-from typing import Dict, Any
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import JSONResponse
+from time import perf_counter_ns
+from typing import Dict, Any, Optional, Tuple
+import orjson
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse, Response
 
 from ..models.mcp_models import (
     MCPListToolsResponse, MCPToolCall, MCPToolResponse,
     MCPServerInfo, MCPTool, MCPToolParameter, MCPToolParameterType
 )
+from ..models.ticket import TicketPriority, TicketCategory
 from ..mcp_server import mcp_server
-from ..config import settings
+from ..services import vector_store
+from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/mcp", tags=["mcp"])
 
+# Shared schema building blocks
+_PRIORITY_ENUM = [p.value for p in TicketPriority]
+_CATEGORY_ENUM = [c.value for c in TicketCategory]
+_TICKET_ID_PARAM = MCPToolParameter(type=MCPToolParameterType.INTEGER, description="Ticket ID", required=True)
+_LIMIT_PARAM = MCPToolParameter(type=MCPToolParameterType.INTEGER, description="Maximum results", required=False)
+
+# Tool schemas are static, so build them once at import
+MCP_TOOLS = [
+    MCPTool(
+        name="create_ticket",
+        description="Create a new incident ticket",
+        parameters={
+            "title": MCPToolParameter(type=MCPToolParameterType.STRING, description="Ticket title", required=True),
+            "description": MCPToolParameter(type=MCPToolParameterType.STRING, description="Detailed description", required=True),
+            "priority": MCPToolParameter(type=MCPToolParameterType.STRING, description="Priority level", required=False, enum=_PRIORITY_ENUM),
+            "category": MCPToolParameter(type=MCPToolParameterType.STRING, description="Issue category", required=False, enum=_CATEGORY_ENUM),
+            "assignee": MCPToolParameter(type=MCPToolParameterType.STRING, description="Assigned user", required=False),
+            "reporter": MCPToolParameter(type=MCPToolParameterType.STRING, description="Reporting user", required=True),
+            "tags": MCPToolParameter(type=MCPToolParameterType.ARRAY, description="Tags list", required=False)
+        }
+    ),
+    MCPTool(
+        name="list_tickets",
+        description="List tickets with optional filtering",
+        parameters={
+            "status": MCPToolParameter(type=MCPToolParameterType.ARRAY, description="Filter by status", required=False),
+            "priority": MCPToolParameter(type=MCPToolParameterType.ARRAY, description="Filter by priority", required=False),
+            "category": MCPToolParameter(type=MCPToolParameterType.ARRAY, description="Filter by category", required=False),
+            "assignee": MCPToolParameter(type=MCPToolParameterType.STRING, description="Filter by assignee", required=False),
+            "reporter": MCPToolParameter(type=MCPToolParameterType.STRING, description="Filter by reporter", required=False),
+            "limit": _LIMIT_PARAM
+        }
+    ),
+    MCPTool(
+        name="get_ticket",
+        description="Get detailed ticket information",
+        parameters={
+            "ticket_id": _TICKET_ID_PARAM,
+            "include_ai_insights": MCPToolParameter(type=MCPToolParameterType.BOOLEAN, description="Include AI insights", required=False)
+        }
+    ),
+    MCPTool(
+        name="update_ticket",
+        description="Update an existing ticket",
+        parameters={
+            "ticket_id": _TICKET_ID_PARAM,
+            "title": MCPToolParameter(type=MCPToolParameterType.STRING, description="New title", required=False),
+            "description": MCPToolParameter(type=MCPToolParameterType.STRING, description="New description", required=False),
+            "status": MCPToolParameter(type=MCPToolParameterType.STRING, description="New status", required=False),
+            "priority": MCPToolParameter(type=MCPToolParameterType.STRING, description="New priority", required=False),
+            "category": MCPToolParameter(type=MCPToolParameterType.STRING, description="New category", required=False),
+            "assignee": MCPToolParameter(type=MCPToolParameterType.STRING, description="New assignee", required=False),
+            "resolution_notes": MCPToolParameter(type=MCPToolParameterType.STRING, description="Resolution notes", required=False),
+            "tags": MCPToolParameter(type=MCPToolParameterType.ARRAY, description="New tags", required=False)
+        }
+    ),
+    MCPTool(
+        name="search_tickets",
+        description="Search tickets using semantic search and RAG",
+        parameters={
+            "query": MCPToolParameter(type=MCPToolParameterType.STRING, description="Search query", required=True),
+            "limit": _LIMIT_PARAM,
+            "use_semantic_search": MCPToolParameter(type=MCPToolParameterType.BOOLEAN, description="Use AI search", required=False)
+        }
+    ),
+    MCPTool(
+        name="get_ticket_analytics",
+        description="Get ticket statistics and analytics",
+        parameters={}
+    ),
+    MCPTool(
+        name="generate_ticket_insights",
+        description="Generate AI-powered insights from ticket data",
+        parameters={
+            "ticket_ids": MCPToolParameter(type=MCPToolParameterType.ARRAY, description="Specific ticket IDs", required=False),
+            "limit": MCPToolParameter(type=MCPToolParameterType.INTEGER, description="Number of tickets to analyze", required=False)
+        }
+    )
+]
+
+@functools.lru_cache(maxsize=1)
+def _server_payloads() -> Tuple[bytes, bytes, Dict[str, bytes]]:
+    """Serialize /info, the /tools summary and per-tool schemas once."""
+    settings = get_settings()
+    server_info = MCPServerInfo(
+        name=settings.mcp_server_name,
+        version=settings.mcp_server_version,
+        description="RAG-based ticketing system with MCP support for Semantic Kernel integration",
+        capabilities=[
+            "tools",
+            "prompts", 
+            "resources",
+            "semantic_search",
+            "ai_insights"
+        ],
+        tools=MCP_TOOLS,
+        prompts=[]  # We could add prompts later
+    )
+    info = server_info.model_dump(mode="json")
+    summaries = [
+        {"name": tool["name"], "description": tool["description"], "param_count": len(tool["parameters"])}
+        for tool in info["tools"]
+    ]
+    schemas = {tool["name"]: orjson.dumps(tool) for tool in info["tools"]}
+    return orjson.dumps(info), orjson.dumps({"tools": summaries}), schemas
+
+@functools.lru_cache(maxsize=32)
+def _etag(body: bytes) -> str:
+    """Strong ETag for a static response body."""
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match list against etag (RFC 9110, 13.1.2)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+def _static_json(request: Request, body: bytes) -> Response:
+    """Serve a static JSON body, answering 304 when the client's ETag matches."""
+    etag = _etag(body)
+    headers = {"etag": etag, "cache-control": "public, max-age=60"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 @router.get("/info", response_model=MCPServerInfo)
-async def get_server_info():
+async def get_server_info(request: Request):
     """Get MCP server information and capabilities."""
-    try:
-        tools = [
-            MCPTool(
-                name="create_ticket",
-                description="Create a new incident ticket",
-                parameters={
-                    "title": MCPToolParameter(type=MCPToolParameterType.STRING, description="Ticket title", required=True),
-                    "description": MCPToolParameter(type=MCPToolParameterType.STRING, description="Detailed description", required=True),
-                    "priority": MCPToolParameter(type=MCPToolParameterType.STRING, description="Priority level", required=False, enum=["low", "medium", "high", "critical"]),
-                    "category": MCPToolParameter(type=MCPToolParameterType.STRING, description="Issue category", required=False, enum=["hardware", "software", "network", "access", "performance", "security", "other"]),
-                    "assignee": MCPToolParameter(type=MCPToolParameterType.STRING, description="Assigned user", required=False),
-                    "reporter": MCPToolParameter(type=MCPToolParameterType.STRING, description="Reporting user", required=True),
-                    "tags": MCPToolParameter(type=MCPToolParameterType.ARRAY, description="Tags list", required=False)
-                }
-            ),
-            MCPTool(
-                name="list_tickets",
-                description="List tickets with optional filtering",
-                parameters={
-                    "status": MCPToolParameter(type=MCPToolParameterType.ARRAY, description="Filter by status", required=False),
-                    "priority": MCPToolParameter(type=MCPToolParameterType.ARRAY, description="Filter by priority", required=False),
-                    "category": MCPToolParameter(type=MCPToolParameterType.ARRAY, description="Filter by category", required=False),
-                    "assignee": MCPToolParameter(type=MCPToolParameterType.STRING, description="Filter by assignee", required=False),
-                    "reporter": MCPToolParameter(type=MCPToolParameterType.STRING, description="Filter by reporter", required=False),
-                    "limit": MCPToolParameter(type=MCPToolParameterType.INTEGER, description="Maximum results", required=False)
-                }
-            ),
-            MCPTool(
-                name="get_ticket",
-                description="Get detailed ticket information",
-                parameters={
-                    "ticket_id": MCPToolParameter(type=MCPToolParameterType.INTEGER, description="Ticket ID", required=True),
-                    "include_ai_insights": MCPToolParameter(type=MCPToolParameterType.BOOLEAN, description="Include AI insights", required=False)
-                }
-            ),
-            MCPTool(
-                name="update_ticket",
-                description="Update an existing ticket",
-                parameters={
-                    "ticket_id": MCPToolParameter(type=MCPToolParameterType.INTEGER, description="Ticket ID", required=True),
-                    "title": MCPToolParameter(type=MCPToolParameterType.STRING, description="New title", required=False),
-                    "description": MCPToolParameter(type=MCPToolParameterType.STRING, description="New description", required=False),
-                    "status": MCPToolParameter(type=MCPToolParameterType.STRING, description="New status", required=False),
-                    "priority": MCPToolParameter(type=MCPToolParameterType.STRING, description="New priority", required=False),
-                    "category": MCPToolParameter(type=MCPToolParameterType.STRING, description="New category", required=False),
-                    "assignee": MCPToolParameter(type=MCPToolParameterType.STRING, description="New assignee", required=False),
-                    "resolution_notes": MCPToolParameter(type=MCPToolParameterType.STRING, description="Resolution notes", required=False),
-                    "tags": MCPToolParameter(type=MCPToolParameterType.ARRAY, description="New tags", required=False)
-                }
-            ),
-            MCPTool(
-                name="search_tickets",
-                description="Search tickets using semantic search and RAG",
-                parameters={
-                    "query": MCPToolParameter(type=MCPToolParameterType.STRING, description="Search query", required=True),
-                    "limit": MCPToolParameter(type=MCPToolParameterType.INTEGER, description="Maximum results", required=False),
-                    "use_semantic_search": MCPToolParameter(type=MCPToolParameterType.BOOLEAN, description="Use AI search", required=False)
-                }
-            ),
-            MCPTool(
-                name="get_ticket_analytics",
-                description="Get ticket statistics and analytics",
-                parameters={}
-            ),
-            MCPTool(
-                name="generate_ticket_insights",
-                description="Generate AI-powered insights from ticket data",
-                parameters={
-                    "ticket_ids": MCPToolParameter(type=MCPToolParameterType.ARRAY, description="Specific ticket IDs", required=False),
-                    "limit": MCPToolParameter(type=MCPToolParameterType.INTEGER, description="Number of tickets to analyze", required=False)
-                }
-            )
-        ]
-        
-        server_info = MCPServerInfo(
-            name=settings.mcp_server_name,
-            version=settings.mcp_server_version,
-            description="RAG-based ticketing system with MCP support for Semantic Kernel integration",
-            capabilities=[
-                "tools",
-                "prompts", 
-                "resources",
-                "semantic_search",
-                "ai_insights"
-            ],
-            tools=tools,
-            prompts=[]  # We could add prompts later
-        )
-        
-        return server_info
-        
-    except Exception as e:
-        logger.error(f"Error getting server info: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return _static_json(request, _server_payloads()[0])
 
 @router.get("/tools", response_model=MCPListToolsResponse)
-async def list_tools():
-    """List all available MCP tools."""
-    try:
-        server_info = await get_server_info()
-        return MCPListToolsResponse(tools=server_info.tools)
-        
-    except Exception as e:
-        logger.error(f"Error listing tools: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+async def list_tools(request: Request):
+    """List available MCP tools as name/description summaries."""
+    return _static_json(request, _server_payloads()[1])
+
+@router.get("/tools/{tool_name}", response_model=MCPTool)
+async def get_tool(tool_name: str, request: Request):
+    """Get the full parameter schema for one MCP tool."""
+    schema = _server_payloads()[2].get(tool_name)
+    if schema is None:
+        raise HTTPException(status_code=404, detail=f"Tool '{tool_name}' not found")
+    return _static_json(request, schema)
 
 @router.post("/call_tool", response_model=MCPToolResponse)
 async def call_tool(tool_call: MCPToolCall):
     """Execute an MCP tool call."""
     try:
-        import time
-        start_time = time.time()
+        # Only read the clock when the caller asked for timing
+        start = perf_counter_ns() if tool_call.measure_time else 0
         
         # Get the MCP server and call the tool
         result = await mcp_server.call_tool(tool_call.tool_name, tool_call.parameters)
-        execution_time = (time.time() - start_time) * 1000
+        execution_time = (perf_counter_ns() - start) / 1_000_000 if tool_call.measure_time else None
         
-        return MCPToolResponse(
-            success=result.get("success", False),
-            result=result,
-            execution_time_ms=execution_time
-        )
+        # Return the tool payload as-is; orjson encodes enums and datetimes natively
+        return ORJSONResponse(content={
+            "success": result.get("success", False),
+            "result": result,
+            "error": None,
+            "execution_time_ms": execution_time
+        })
         
     except Exception as e:
-        logger.error(f"Error calling tool: {e}")
-        return MCPToolResponse(
-            success=False,
-            error=str(e)
-        )
+        logger.error("Error calling tool: %s", e)
+        return ORJSONResponse(content={
+            "success": False,
+            "result": None,
+            "error": str(e),
+            "execution_time_ms": None
+        })
 
 @router.get("/health")
 async def health_check():
     """Health check endpoint for MCP server."""
     try:
-        # Check if services are initialized
-        from ..services import ticket_service, vector_store, rag_service
-        
-        await ticket_service.initialize()
-        await vector_store.initialize()
-        await rag_service.initialize()
-        
-        # Get basic stats
+        # Services are initialized once in the app lifespan; just probe the store
         stats = await vector_store.get_collection_stats()
+        settings = get_settings()
         
-        return {
+        return ORJSONResponse(content={
             "status": "healthy",
             "server_name": settings.mcp_server_name,
             "version": settings.mcp_server_version,
@@ -175,11 +217,11 @@ async def health_check():
                 "rag_service": "ready"
             },
             "vector_store_stats": stats
-        }
+        })
         
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        return JSONResponse(
+        logger.error("Health check failed: %s", e)
+        return ORJSONResponse(
             status_code=503,
             content={
                 "status": "unhealthy",
@@ -187,32 +229,35 @@ async def health_check():
             }
         )
 
-@router.get("/prompts")
-async def list_prompts():
-    """List available MCP prompts (placeholder for future expansion)."""
-    return {
-        "prompts": [
-            {
-                "name": "ticket_analysis",
-                "description": "Analyze ticket patterns and suggest improvements",
-                "arguments": {
-                    "time_period": {
-                        "type": "string",
-                        "description": "Analysis time period (e.g., '7d', '30d', '90d')",
-                        "required": False
-                    }
+# Static prompt listing, encoded once at import
+_PROMPTS_BYTES = orjson.dumps({
+    "prompts": [
+        {
+            "name": "ticket_analysis",
+            "description": "Analyze ticket patterns and suggest improvements",
+            "arguments": {
+                "time_period": {
+                    "type": "string",
+                    "description": "Analysis time period (e.g., '7d', '30d', '90d')",
+                    "required": False
                 }
-            },
-            {
-                "name": "resolution_guide",
-                "description": "Generate resolution guidance for specific ticket types",
-                "arguments": {
-                    "category": {
-                        "type": "string", 
-                        "description": "Ticket category to generate guidance for",
-                        "required": True
-                    }
+            }
+        },
+        {
+            "name": "resolution_guide",
+            "description": "Generate resolution guidance for specific ticket types",
+            "arguments": {
+                "category": {
+                    "type": "string", 
+                    "description": "Ticket category to generate guidance for",
+                    "required": True
                 }
             }
-        ]
-    }
+        }
+    ]
+})
+
+@router.get("/prompts")
+async def list_prompts(request: Request):
+    """List available MCP prompts (placeholder for future expansion)."""
+    return _static_json(request, _PROMPTS_BYTES)
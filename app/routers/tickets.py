@@ -3,201 +3,177 @@ REST API router for ticket operations.
 Provides traditional REST endpoints alongside MCP functionality.
 """
 import logging
-from typing import List, Optional
+from typing import Annotated, Any, List, Optional
 from fastapi import APIRouter, HTTPException, Query, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 
 from ..models.ticket import (
     Ticket, TicketCreate, TicketUpdate, TicketSearchRequest, 
     TicketSearchResult, TicketAnalytics, TicketStatus, 
     TicketPriority, TicketCategory
 )
-from ..services import ticket_service
+from ..services import ticket_service, vector_store
+from ..services.ticket_service import TicketService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/tickets", tags=["tickets"])
 
-# Dependency to ensure service is initialized
-async def get_ticket_service():
+# Every endpoint serializes through pydantic-core, so models, lists and dicts
+# render datetimes and enums identically
+_ANY_ADAPTER = TypeAdapter(Any)
+
+def _json_response(content: Any, status_code: int = 200) -> Response:
+    """Serialize content with pydantic-core, skipping response_model re-validation."""
+    return Response(content=_ANY_ADAPTER.dump_json(content), status_code=status_code, media_type="application/json")
+
+# Dependency returning the service; the app lifespan initializes it once at startup
+async def get_ticket_service() -> TicketService:
     """Dependency to get initialized ticket service."""
-    await ticket_service.initialize()
     return ticket_service
 
+TicketSvc = Annotated[TicketService, Depends(get_ticket_service)]
+
+# Query parameter declarations shared by the listing endpoints
+Skip = Annotated[int, Query(ge=0, description="Number of tickets to skip")]
+Limit = Annotated[int, Query(ge=1, le=1000, description="Maximum number of tickets to return")]
+StatusFilter = Annotated[Optional[List[TicketStatus]], Query(description="Filter by status")]
+PriorityFilter = Annotated[Optional[List[TicketPriority]], Query(description="Filter by priority")]
+CategoryFilter = Annotated[Optional[List[TicketCategory]], Query(description="Filter by category")]
+AssigneeFilter = Annotated[Optional[str], Query(description="Filter by assignee")]
+ReporterFilter = Annotated[Optional[str], Query(description="Filter by reporter")]
+SimilarLimit = Annotated[int, Query(ge=1, le=20, description="Number of similar tickets to return")]
+
 @router.post("/", response_model=Ticket, status_code=201)
 async def create_ticket(
     ticket_data: TicketCreate,
-    service = Depends(get_ticket_service)
+    service: TicketSvc
 ):
     """Create a new incident ticket."""
-    try:
-        ticket = await service.create_ticket(ticket_data)
-        return ticket
-    except Exception as e:
-        logger.error(f"Error creating ticket: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    ticket = await service.create_ticket(ticket_data)
+    return _json_response(ticket, status_code=201)
 
 @router.get("/", response_model=List[Ticket])
 async def list_tickets(
-    skip: int = Query(0, ge=0, description="Number of tickets to skip"),
-    limit: int = Query(100, ge=1, le=1000, description="Maximum number of tickets to return"),
-    status: Optional[List[TicketStatus]] = Query(None, description="Filter by status"),
-    priority: Optional[List[TicketPriority]] = Query(None, description="Filter by priority"),
-    category: Optional[List[TicketCategory]] = Query(None, description="Filter by category"),
-    assignee: Optional[str] = Query(None, description="Filter by assignee"),
-    reporter: Optional[str] = Query(None, description="Filter by reporter"),
-    service = Depends(get_ticket_service)
+    service: TicketSvc,
+    skip: Skip = 0,
+    limit: Limit = 100,
+    status: StatusFilter = None,
+    priority: PriorityFilter = None,
+    category: CategoryFilter = None,
+    assignee: AssigneeFilter = None,
+    reporter: ReporterFilter = None
 ):
     """List tickets with optional filtering and pagination."""
-    try:
-        tickets = await service.list_tickets(
-            skip=skip,
-            limit=limit,
-            status=status,
-            priority=priority,
-            category=category,
-            assignee=assignee,
-            reporter=reporter
-        )
-        return tickets
-    except Exception as e:
-        logger.error(f"Error listing tickets: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    tickets = await service.list_tickets(
+        skip=skip,
+        limit=limit,
+        status=status,
+        priority=priority,
+        category=category,
+        assignee=assignee,
+        reporter=reporter
+    )
+    
+    return _json_response(tickets)
 
 @router.get("/{ticket_id}", response_model=Ticket)
 async def get_ticket(
     ticket_id: int,
-    service = Depends(get_ticket_service)
+    service: TicketSvc
 ):
     """Get a specific ticket by ID."""
-    try:
-        ticket = await service.get_ticket(ticket_id)
-        if not ticket:
-            raise HTTPException(status_code=404, detail=f"Ticket {ticket_id} not found")
-        return ticket
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting ticket {ticket_id}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    ticket = await service.get_ticket(ticket_id)
+    if not ticket:
+        raise HTTPException(status_code=404, detail=f"Ticket {ticket_id} not found")
+    return _json_response(ticket)
 
 @router.put("/{ticket_id}", response_model=Ticket)
 async def update_ticket(
     ticket_id: int,
     ticket_data: TicketUpdate,
-    service = Depends(get_ticket_service)
+    service: TicketSvc
 ):
     """Update an existing ticket."""
-    try:
-        ticket = await service.update_ticket(ticket_id, ticket_data)
-        if not ticket:
-            raise HTTPException(status_code=404, detail=f"Ticket {ticket_id} not found")
-        return ticket
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error updating ticket {ticket_id}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    ticket = await service.update_ticket(ticket_id, ticket_data)
+    if not ticket:
+        raise HTTPException(status_code=404, detail=f"Ticket {ticket_id} not found")
+    return _json_response(ticket)
 
 @router.delete("/{ticket_id}", status_code=204)
 async def delete_ticket(
     ticket_id: int,
-    service = Depends(get_ticket_service)
+    service: TicketSvc
 ):
     """Delete a ticket."""
-    try:
-        success = await service.delete_ticket(ticket_id)
-        if not success:
-            raise HTTPException(status_code=404, detail=f"Ticket {ticket_id} not found")
-        return
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error deleting ticket {ticket_id}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    success = await service.delete_ticket(ticket_id)
+    if not success:
+        raise HTTPException(status_code=404, detail=f"Ticket {ticket_id} not found")
+    return
 
 @router.post("/search", response_model=TicketSearchResult)
 async def search_tickets(
     search_request: TicketSearchRequest,
-    service = Depends(get_ticket_service)
+    service: TicketSvc
 ):
     """Search tickets using semantic search and RAG."""
-    try:
-        results = await service.search_tickets(search_request)
-        
-        search_result = TicketSearchResult(
-            tickets=results["tickets"],
-            total_count=results["total_count"],
-            search_time_ms=results["search_time_ms"],
-            query=results["query"]
-        )
-        
-        return search_result
-    except Exception as e:
-        logger.error(f"Error searching tickets: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    results = await service.search_tickets(search_request)
+    
+    # The service returns validated Ticket models, so skip re-validating them
+    search_result = TicketSearchResult.model_construct(
+        tickets=results["tickets"],
+        total_count=results["total_count"],
+        search_time_ms=results["search_time_ms"],
+        query=results["query"]
+    )
+    
+    return _json_response(search_result)
 
 @router.get("/analytics/summary", response_model=TicketAnalytics)
 async def get_ticket_analytics(
-    service = Depends(get_ticket_service)
+    service: TicketSvc
 ):
     """Get ticket analytics and statistics."""
-    try:
-        analytics = await service.get_ticket_analytics()
-        return analytics
-    except Exception as e:
-        logger.error(f"Error getting ticket analytics: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    analytics = await service.get_ticket_analytics()
+    return _json_response(analytics)
 
 @router.get("/{ticket_id}/insights")
 async def get_ticket_insights(
     ticket_id: int,
-    service = Depends(get_ticket_service)
+    service: TicketSvc
 ):
     """Get AI-generated insights for a specific ticket."""
-    try:
-        insights = await service.get_ticket_with_ai_insights(ticket_id)
-        if not insights:
-            raise HTTPException(status_code=404, detail=f"Ticket {ticket_id} not found")
-        return insights
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting ticket insights: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    insights = await service.get_ticket_with_ai_insights(ticket_id)
+    if not insights:
+        raise HTTPException(status_code=404, detail=f"Ticket {ticket_id} not found")
+    return _json_response(insights)
 
 @router.get("/{ticket_id}/similar")
 async def get_similar_tickets(
     ticket_id: int,
-    limit: int = Query(5, ge=1, le=20, description="Number of similar tickets to return"),
-    service = Depends(get_ticket_service)
+    service: TicketSvc,
+    limit: SimilarLimit = 5
 ):
     """Get tickets similar to the specified ticket."""
-    try:
+    if not await service.ticket_exists(ticket_id):
+        raise HTTPException(status_code=404, detail=f"Ticket {ticket_id} not found")
+    
+    # Search from the indexed text; only load the ticket if it is not indexed yet
+    similar_results = await vector_store.get_similar_by_id(ticket_id, limit + 1)
+    if similar_results is None:
         ticket = await service.get_ticket(ticket_id)
-        if not ticket:
-            raise HTTPException(status_code=404, detail=f"Ticket {ticket_id} not found")
-        
-        from ..services.vector_store import vector_store
         similar_results = await vector_store.get_similar_tickets(ticket, limit + 1)
-        
-        # Remove the original ticket from results and get ticket details
-        similar_ticket_ids = [tid for tid, score in similar_results if tid != ticket_id][:limit]
-        
-        similar_tickets = []
-        for tid in similar_ticket_ids:
-            similar_ticket = await service.get_ticket(tid)
-            if similar_ticket:
-                similar_tickets.append(similar_ticket)
-        
-        return {
-            "ticket_id": ticket_id,
-            "similar_tickets": similar_tickets,
-            "total_found": len(similar_tickets)
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting similar tickets: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    
+    # Remove the original ticket from results and get ticket details
+    similar_ticket_ids = [tid for tid, score in similar_results if tid != ticket_id][:limit]
+    
+    # Load all neighbours in one query, keeping similarity order
+    tickets_by_id = await service.get_tickets_by_ids(similar_ticket_ids)
+    similar_tickets = [tickets_by_id[tid] for tid in similar_ticket_ids if tid in tickets_by_id]
+    
+    return _json_response({
+        "ticket_id": ticket_id,
+        "similar_tickets": similar_tickets,
+        "total_found": len(similar_tickets)
+    })
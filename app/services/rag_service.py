@@ -4,20 +4,317 @@ This is a basic implementation without external AI dependencies.
 """
 import logging
 import asyncio
-from typing import List, Dict, Any, Optional
+import re
+import time
+from collections import Counter
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Tuple, Iterable, AsyncIterator
 from datetime import datetime
-from ..config import settings
-from ..models.ticket import Ticket, TicketSearchRequest
+from ..models.ticket import (
+    Ticket, TicketSearchRequest, TicketStatus, TicketPriority, TicketCategory, STATUS_TO_STR, PRIORITY_TO_STR, CATEGORY_TO_STR
+)
 from .vector_store import vector_store
 
 logger = logging.getLogger(__name__)
 
+# Rule tables for summaries and resolution suggestions
+_PRIORITY_TEXT = {
+    "low": "low priority",
+    "medium": "medium priority", 
+    "high": "high priority",
+    "critical": "critical priority"
+}
+
+_CATEGORY_TEXT = {
+    "hardware": "hardware-related",
+    "software": "software-related",
+    "network": "network-related",
+    "access": "access-related",
+    "performance": "performance-related",
+    "security": "security-related",
+    "other": "general"
+}
+
+_CATEGORY_SUGGESTIONS = {
+    "hardware": (
+        "1. Check physical connections and power supply",
+        "2. Run hardware diagnostics",
+        "3. Check for firmware updates", 
+        "4. Contact hardware vendor if under warranty"
+    ),
+    "software": (
+        "1. Restart the application or service",
+        "2. Check for software updates",
+        "3. Review error logs for specific issues",
+        "4. Reinstall software if necessary"
+    ),
+    "network": (
+        "1. Check network cable connections",
+        "2. Restart network equipment (router, switch)",
+        "3. Test connectivity with ping/traceroute",
+        "4. Contact network administrator"
+    ),
+    "access": (
+        "1. Verify user credentials",
+        "2. Check account status and permissions",
+        "3. Reset password if necessary",
+        "4. Contact system administrator"
+    ),
+    "performance": (
+        "1. Monitor system resource usage",
+        "2. Close unnecessary applications",
+        "3. Clear temporary files and cache",
+        "4. Consider system upgrade if resources are insufficient"
+    ),
+    "security": (
+        "1. Run security scan immediately",
+        "2. Change all passwords",
+        "3. Review access logs",
+        "4. Contact security team"
+    )
+}
+
+_DEFAULT_SUGGESTIONS = (
+    "1. Gather more information about the issue",
+    "2. Document steps to reproduce the problem",
+    "3. Check system logs for errors",
+    "4. Escalate to appropriate technical team"
+)
+
+# Suggestion blocks joined once so suggest_resolution only does lookups
+_CATEGORY_SUGGESTIONS_TEXT = {
+    category: "\n".join(steps) for category, steps in _CATEGORY_SUGGESTIONS.items()
+}
+_DEFAULT_SUGGESTIONS_TEXT = "\n".join(_DEFAULT_SUGGESTIONS)
+
+_STATUS_DISPLAY = {s.value: s.value.replace('_', ' ') for s in TicketStatus}
+
+_PRIORITY_NOTES = {
+    "critical": "⚠️ URGENT: This is a critical issue requiring immediate attention.",
+    "high": "⏰ HIGH PRIORITY: Address this issue as soon as possible.",
+    "medium": "📋 MEDIUM PRIORITY: Address within normal business hours.",
+    "low": "📝 LOW PRIORITY: Can be addressed during routine maintenance."
+}
+
+_TIMELINE_ESTIMATES = {
+    "critical": "Target resolution: Within 1 hour",
+    "high": "Target resolution: Within 4 hours", 
+    "medium": "Target resolution: Within 24 hours",
+    "low": "Target resolution: Within 1 week"
+}
+
+# Keyword sets for rule-based sentiment analysis
+_URGENT_KEYWORDS = frozenset(["urgent", "critical", "emergency", "asap", "immediately", "broken", "down", "failed"])
+_NEGATIVE_KEYWORDS = frozenset(["frustrated", "angry", "unacceptable", "terrible", "awful", "worst"])
+_POSITIVE_KEYWORDS = frozenset(["thank", "appreciate", "good", "excellent", "working"])
+
+# One pass over the text finds every keyword occurrence; the lookahead keeps
+# overlapping hits so each keyword is tallied like str.count would
+_SENTIMENT_RE = re.compile(
+    "(?=(?:(?P<urgent>{})|(?P<negative>{})|(?P<positive>{})))".format(
+        *("|".join(map(re.escape, sorted(words))) for words in
+          (_URGENT_KEYWORDS, _NEGATIVE_KEYWORDS, _POSITIVE_KEYWORDS))
+    )
+)
+_MIN_KEYWORD_LEN = min(map(len, _URGENT_KEYWORDS | _NEGATIVE_KEYWORDS | _POSITIVE_KEYWORDS))
+
+# Summaries show this many description characters, then an ellipsis
+_PREVIEW_LEN = 100
+
+# Rule outputs are pure functions of a few ticket fields, so they are cached by
+# those values; an edited ticket produces a new key rather than a stale hit
+RULE_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=RULE_CACHE_SIZE)
+def _summary_for(
+    priority: str,
+    category: str,
+    status: str,
+    reporter: str,
+    assignee: Optional[str],
+    description_head: str
+) -> str:
+    """Build the rule-based summary for the given ticket fields.
+    
+    description_head is the description cut to _PREVIEW_LEN + 1 characters:
+    enough to decide on the ellipsis without keying the cache on full text.
+    """
+    assigned = f". assigned to {assignee}" if assignee else ""
+    ellipsis = "…" if len(description_head) > _PREVIEW_LEN else ""
+    
+    return (
+        f"{_SUMMARY_HEADS[priority, category]}. reported by {reporter}{assigned}"
+        f". with status: {_STATUS_DISPLAY[status]}. Description: {description_head[:_PREVIEW_LEN]}{ellipsis}."
+    )
+
+def _build_resolution(category: str, priority: str) -> str:
+    """Build the resolution suggestion text for a category/priority pair."""
+    suggestions = _CATEGORY_SUGGESTIONS_TEXT.get(category, _DEFAULT_SUGGESTIONS_TEXT)
+    timeline = _TIMELINE_ESTIMATES.get(priority, "Target resolution: As resources permit")
+    
+    # Priority-specific note heads the text when one exists
+    note = _PRIORITY_NOTES.get(priority)
+    header = f"{note}\n\n" if note else ""
+    
+    return f"{header}Suggested resolution steps:\n{suggestions}\n\n{timeline}"
+
+# Priority and category are closed enums, so the parts that depend only on them
+# are evaluated for every combination up front and looked up by value pair
+_SUMMARY_HEADS = {
+    (p.value, c.value): f"This is a {_PRIORITY_TEXT.get(p.value, 'unknown')} {_CATEGORY_TEXT.get(c.value, 'general')} issue"
+    for p in TicketPriority for c in TicketCategory
+}
+_RESOLUTIONS = {
+    (c.value, p.value): _build_resolution(c.value, p.value)
+    for c in TicketCategory for p in TicketPriority
+}
+
+def _rate_sentiment(
+    priority: str,
+    urgent_count: int,
+    negative_count: int,
+    positive_count: int
+) -> Tuple[str, str, Tuple[str, ...], str, str]:
+    """Apply the sentiment rules to keyword counts, returning (sentiment, urgency, concerns, action, analysis)."""
+    # Determine sentiment
+    if positive_count > negative_count:
+        sentiment = "positive"
+    elif negative_count > 0 or urgent_count > 0:
+        sentiment = "negative"
+    else:
+        sentiment = "neutral"
+    
+    # Determine urgency
+    if priority == "critical" or urgent_count >= 2:
+        urgency = "critical"
+    elif priority == "high" or urgent_count >= 1:
+        urgency = "high"
+    elif priority == "medium":
+        urgency = "medium"
+    else:
+        urgency = "low"
+    
+    # Generate key concerns
+    concerns = []
+    if urgent_count > 0:
+        concerns.append("User indicates urgency")
+    if negative_count > 0:
+        concerns.append("User expresses frustration")
+    if priority in ["critical", "high"]:
+        concerns.append("High priority issue")
+    if not concerns:
+        concerns.append("Standard support request")
+    
+    # Recommended action
+    if urgency == "critical":
+        action = "immediate"
+    elif urgency == "high":
+        action = "priority"
+    else:
+        action = "standard"
+    
+    analysis = f"""Sentiment: {sentiment}
+Urgency Level: {urgency}
+Key Concerns: {', '.join(concerns)}
+Recommended Action: {action} response"""
+    
+    return sentiment, urgency, tuple(concerns), action, analysis
+
+# The rules only distinguish 0/1/2+ urgent hits, whether any negative hit
+# occurred, and whether positives outnumber negatives, so every outcome is
+# precomputed at import and looked up by those levels plus the priority
+_SENTIMENT_TABLE = {
+    (urgent_level, has_negative, positive_wins, p.value): _rate_sentiment(
+        p.value,
+        urgent_level,
+        int(has_negative),
+        int(has_negative) + 1 if positive_wins else 0
+    )
+    for urgent_level in range(3)
+    for has_negative in (False, True)
+    for positive_wins in (False, True)
+    for p in TicketPriority
+}
+
+@lru_cache(maxsize=RULE_CACHE_SIZE)
+def _sentiment_for(priority: str, title: str, description: str) -> Tuple[str, str, Tuple[str, ...], str, str]:
+    """Return (sentiment, urgency, concerns, action, analysis) for the given ticket fields."""
+    text_to_analyze = (title + " " + description).lower()
+    
+    # Text shorter than the shortest keyword cannot match anything
+    if len(text_to_analyze) < _MIN_KEYWORD_LEN:
+        return _SENTIMENT_TABLE[0, False, False, priority]
+    
+    # Count every keyword occurrence, bucketed by sentiment
+    matched = Counter(match.lastgroup for match in _SENTIMENT_RE.finditer(text_to_analyze))
+    negative_count = matched["negative"]
+    
+    return _SENTIMENT_TABLE[
+        min(matched["urgent"], 2),
+        negative_count > 0,
+        matched["positive"] > negative_count,
+        priority
+    ]
+
+# Insight timestamps are reused for up to half a second instead of formatting
+# a fresh datetime on every call
+_TIMESTAMP_REFRESH_SECONDS = 0.5
+_last_timestamp = [0.0, ""]
+
+def _now_iso() -> str:
+    """Return the current local time in ISO format, refreshed at most every half second."""
+    now = time.time()
+    if now - _last_timestamp[0] >= _TIMESTAMP_REFRESH_SECONDS:
+        _last_timestamp[:] = [now, datetime.fromtimestamp(now).isoformat()]
+    return _last_timestamp[1]
+
+# Insight statistics are accumulated in chunks of this many tickets
+INSIGHTS_CHUNK_SIZE = 1000
+
+_get_status = attrgetter("status")
+_get_priority = attrgetter("priority")
+_get_category = attrgetter("category")
+
+def _insights_text(
+    total_tickets: int,
+    status_counts: Dict[str, int],
+    priority_counts: Dict[str, int],
+    category_counts: Dict[str, int]
+) -> str:
+    """Render the human-readable insights report from the distributions."""
+    # Find most common issues
+    most_common_category = max(category_counts, key=category_counts.get)
+    most_common_priority = max(priority_counts, key=priority_counts.get)
+    
+    return f"""Analysis of {total_tickets} tickets:
+
+1. Common Themes:
+   - Most common category: {most_common_category} ({category_counts[most_common_category]} tickets)
+   - Most common priority: {most_common_priority} ({priority_counts[most_common_priority]} tickets)
+
+2. Status Distribution:
+   {', '.join([f'{status}: {count}' for status, count in status_counts.items()])}
+
+3. Priority Distribution:
+   {', '.join([f'{priority}: {count}' for priority, count in priority_counts.items()])}
+
+4. Category Distribution:
+   {', '.join([f'{category}: {count}' for category, count in category_counts.items()])}
+
+5. Recommendations:
+   - Focus on {most_common_category} issues for process improvement
+   - Consider dedicated resources for {most_common_priority} priority tickets
+   - Monitor trends in ticket volume and resolution times"""
+
 class SimpleRAGService:
     """Simple RAG service for basic ticket analysis without external AI dependencies."""
     
     def __init__(self):
         """Initialize the simple RAG service."""
-        self._initialized = False
+        # No external resources to set up, so the service is ready immediately
+        self._initialized = True
     
     async def initialize(self):
         """Initialize the RAG service."""
@@ -29,53 +326,54 @@ class SimpleRAGService:
             logger.info("Simple RAG service initialized successfully")
             
         except Exception as e:
-            logger.error(f"Failed to initialize RAG service: {e}")
+            logger.error("Failed to initialize RAG service: %s", e)
             raise
     
+    async def healthcheck(self) -> Dict[str, Any]:
+        """Report service status without running any analysis."""
+        return {"status": "healthy" if self._initialized else "not_initialized"}
+    
     async def search_tickets_with_context(
         self, 
-        search_request: TicketSearchRequest
+        search_request: TicketSearchRequest,
+        include_scores: bool = True
     ) -> Dict[str, Any]:
         """
         Search tickets and provide contextual information.
+        
+        With include_scores=False, similarity_scores is None and only the ranked ids are returned.
         """
         try:
-            await self.initialize()
-            
-            start_time = datetime.now()
+            start = time.perf_counter()
             
             # Perform vector search if enabled
             if search_request.use_semantic_search:
                 # Build filters for vector search
-                filters = {}
-                if search_request.status:
-                    filters['status'] = [s.value for s in search_request.status]
-                if search_request.priority:
-                    filters['priority'] = [p.value for p in search_request.priority]
-                if search_request.category:
-                    filters['category'] = [c.value for c in search_request.category]
-                if search_request.assignee:
-                    filters['assignee'] = search_request.assignee
-                if search_request.reporter:
-                    filters['reporter'] = search_request.reporter
+                filters = {
+                    key: value for key, value in (
+                        ('status', [STATUS_TO_STR[s] for s in search_request.status] if search_request.status else None),
+                        ('priority', [PRIORITY_TO_STR[p] for p in search_request.priority] if search_request.priority else None),
+                        ('category', [CATEGORY_TO_STR[c] for c in search_request.category] if search_request.category else None),
+                        ('assignee', search_request.assignee),
+                        ('reporter', search_request.reporter)
+                    ) if value
+                }
                 
                 # Search using vector store
-                ticket_results = await vector_store.search_tickets(
+                ticket_ids, scores = await vector_store.search_tickets(
                     query=search_request.query,
                     limit=search_request.limit,
                     filters=filters
                 )
                 
-                # Extract ticket IDs and scores
-                ticket_ids = [result[0] for result in ticket_results]
-                similarity_scores = {result[0]: result[1] for result in ticket_results}
+                similarity_scores = dict(zip(ticket_ids, scores)) if include_scores else None
                 
             else:
                 # Fallback to simple text matching (implement as needed)
                 ticket_ids = []
-                similarity_scores = {}
+                similarity_scores = {} if include_scores else None
             
-            search_time = (datetime.now() - start_time).total_seconds() * 1000
+            search_time = (time.perf_counter() - start) * 1000.0
             
             return {
                 "ticket_ids": ticket_ids,
@@ -85,194 +383,40 @@ class SimpleRAGService:
             }
             
         except Exception as e:
-            logger.error(f"Failed to search tickets with context: {e}")
+            logger.error("Failed to search tickets with context: %s", e)
             raise
     
     async def generate_ticket_summary(self, ticket: Ticket) -> Optional[str]:
         """Generate a basic summary of a ticket (no AI required)."""
         try:
-            await self.initialize()
-            
-            # Create a simple rule-based summary
-            priority_text = {
-                "low": "low priority",
-                "medium": "medium priority", 
-                "high": "high priority",
-                "critical": "critical priority"
-            }
-            
-            category_text = {
-                "hardware": "hardware-related",
-                "software": "software-related",
-                "network": "network-related",
-                "access": "access-related",
-                "performance": "performance-related",
-                "security": "security-related",
-                "other": "general"
-            }
-            
-            # Build summary
-            summary_parts = [
-                f"This is a {priority_text.get(ticket.priority.value, 'unknown')} {category_text.get(ticket.category.value, 'general')} issue",
-                f"reported by {ticket.reporter}"
-            ]
-            
-            if ticket.assignee:
-                summary_parts.append(f"assigned to {ticket.assignee}")
-            
-            summary_parts.append(f"with status: {ticket.status.value.replace('_', ' ')}")
-            
-            # Add description preview
-            desc_preview = ticket.description[:100] + "..." if len(ticket.description) > 100 else ticket.description
-            summary_parts.append(f"Description: {desc_preview}")
-            
-            return ". ".join(summary_parts) + "."
+            return _summary_for(
+                ticket.priority.value,
+                ticket.category.value,
+                ticket.status.value,
+                ticket.reporter,
+                ticket.assignee,
+                ticket.description[:_PREVIEW_LEN + 1]
+            )
             
         except Exception as e:
-            logger.error(f"Failed to generate ticket summary: {e}")
+            logger.error("Failed to generate ticket summary: %s", e)
             return None
     
     async def suggest_resolution(self, ticket: Ticket) -> Optional[str]:
         """Suggest resolution steps based on ticket category and priority."""
         try:
-            await self.initialize()
-            
-            # Rule-based resolution suggestions
-            category_suggestions = {
-                "hardware": [
-                    "1. Check physical connections and power supply",
-                    "2. Run hardware diagnostics",
-                    "3. Check for firmware updates", 
-                    "4. Contact hardware vendor if under warranty"
-                ],
-                "software": [
-                    "1. Restart the application or service",
-                    "2. Check for software updates",
-                    "3. Review error logs for specific issues",
-                    "4. Reinstall software if necessary"
-                ],
-                "network": [
-                    "1. Check network cable connections",
-                    "2. Restart network equipment (router, switch)",
-                    "3. Test connectivity with ping/traceroute",
-                    "4. Contact network administrator"
-                ],
-                "access": [
-                    "1. Verify user credentials",
-                    "2. Check account status and permissions",
-                    "3. Reset password if necessary",
-                    "4. Contact system administrator"
-                ],
-                "performance": [
-                    "1. Monitor system resource usage",
-                    "2. Close unnecessary applications",
-                    "3. Clear temporary files and cache",
-                    "4. Consider system upgrade if resources are insufficient"
-                ],
-                "security": [
-                    "1. Run security scan immediately",
-                    "2. Change all passwords",
-                    "3. Review access logs",
-                    "4. Contact security team"
-                ]
-            }
-            
-            suggestions = category_suggestions.get(ticket.category.value, [
-                "1. Gather more information about the issue",
-                "2. Document steps to reproduce the problem",
-                "3. Check system logs for errors",
-                "4. Escalate to appropriate technical team"
-            ])
-            
-            # Add priority-specific notes
-            priority_notes = {
-                "critical": "⚠️ URGENT: This is a critical issue requiring immediate attention.",
-                "high": "⏰ HIGH PRIORITY: Address this issue as soon as possible.",
-                "medium": "📋 MEDIUM PRIORITY: Address within normal business hours.",
-                "low": "📝 LOW PRIORITY: Can be addressed during routine maintenance."
-            }
-            
-            resolution_text = priority_notes.get(ticket.priority.value, "")
-            if resolution_text:
-                resolution_text += "\n\n"
-            
-            resolution_text += "Suggested resolution steps:\n" + "\n".join(suggestions)
-            
-            # Add estimated timeline
-            timeline_estimates = {
-                "critical": "Target resolution: Within 1 hour",
-                "high": "Target resolution: Within 4 hours", 
-                "medium": "Target resolution: Within 24 hours",
-                "low": "Target resolution: Within 1 week"
-            }
-            
-            timeline = timeline_estimates.get(ticket.priority.value, "Target resolution: As resources permit")
-            resolution_text += f"\n\n{timeline}"
-            
-            return resolution_text
+            return _RESOLUTIONS[ticket.category.value, ticket.priority.value]
             
         except Exception as e:
-            logger.error(f"Failed to suggest resolution: {e}")
+            logger.error("Failed to suggest resolution: %s", e)
             return None
     
     async def analyze_ticket_sentiment(self, ticket: Ticket) -> Optional[Dict[str, Any]]:
         """Analyze the sentiment and urgency of a ticket using simple rules."""
         try:
-            await self.initialize()
-            
-            # Simple keyword-based sentiment analysis
-            urgent_keywords = ["urgent", "critical", "emergency", "asap", "immediately", "broken", "down", "failed"]
-            negative_keywords = ["frustrated", "angry", "unacceptable", "terrible", "awful", "worst"]
-            positive_keywords = ["thank", "appreciate", "good", "excellent", "working"]
-            
-            text_to_analyze = f"{ticket.title} {ticket.description}".lower()
-            
-            # Count keyword occurrences
-            urgent_count = sum(1 for word in urgent_keywords if word in text_to_analyze)
-            negative_count = sum(1 for word in negative_keywords if word in text_to_analyze)
-            positive_count = sum(1 for word in positive_keywords if word in text_to_analyze)
-            
-            # Determine sentiment
-            if positive_count > negative_count:
-                sentiment = "positive"
-            elif negative_count > 0 or urgent_count > 0:
-                sentiment = "negative"
-            else:
-                sentiment = "neutral"
-            
-            # Determine urgency
-            if ticket.priority.value == "critical" or urgent_count >= 2:
-                urgency = "critical"
-            elif ticket.priority.value == "high" or urgent_count >= 1:
-                urgency = "high"
-            elif ticket.priority.value == "medium":
-                urgency = "medium"
-            else:
-                urgency = "low"
-            
-            # Generate key concerns
-            concerns = []
-            if urgent_count > 0:
-                concerns.append("User indicates urgency")
-            if negative_count > 0:
-                concerns.append("User expresses frustration")
-            if ticket.priority.value in ["critical", "high"]:
-                concerns.append("High priority issue")
-            if not concerns:
-                concerns.append("Standard support request")
-            
-            # Recommended action
-            if urgency == "critical":
-                action = "immediate"
-            elif urgency == "high":
-                action = "priority"
-            else:
-                action = "standard"
-            
-            analysis = f"""Sentiment: {sentiment}
-Urgency Level: {urgency}
-Key Concerns: {', '.join(concerns)}
-Recommended Action: {action} response"""
+            sentiment, urgency, concerns, action, analysis = _sentiment_for(
+                ticket.priority.value, ticket.title, ticket.description
+            )
             
             return {
                 "analysis": analysis,
@@ -280,82 +424,113 @@ Recommended Action: {action} response"""
                 "model_used": "rule_based_analyzer",
                 "sentiment": sentiment,
                 "urgency": urgency,
-                "concerns": concerns,
+                "concerns": list(concerns),
                 "recommended_action": action
             }
             
         except Exception as e:
-            logger.error(f"Failed to analyze ticket sentiment: {e}")
+            logger.error("Failed to analyze ticket sentiment: %s", e)
             return None
     
-    async def generate_ticket_insights(self, tickets: List[Ticket]) -> Optional[Dict[str, Any]]:
+    async def generate_summaries(self, tickets: List[Ticket]) -> List[Optional[str]]:
+        """Generate summaries for several tickets concurrently."""
+        return await asyncio.gather(*(self.generate_ticket_summary(t) for t in tickets))
+    
+    async def suggest_resolutions(self, tickets: List[Ticket]) -> List[Optional[str]]:
+        """Suggest resolutions for several tickets concurrently."""
+        return await asyncio.gather(*(self.suggest_resolution(t) for t in tickets))
+    
+    async def analyze_sentiments(self, tickets: List[Ticket]) -> List[Optional[Dict[str, Any]]]:
+        """Analyze sentiment for several tickets concurrently."""
+        return await asyncio.gather(*(self.analyze_ticket_sentiment(t) for t in tickets))
+    
+    async def analyze_tickets_batch(self, tickets: List[Ticket]) -> List[Dict[str, Any]]:
+        """Gather summary and sentiment for each ticket in one batch."""
+        summaries, sentiments = await asyncio.gather(
+            self.generate_summaries(tickets),
+            self.analyze_sentiments(tickets)
+        )
+        
+        return [
+            {"ticket_id": ticket.id, "summary": summary, "sentiment": sentiment}
+            for ticket, summary, sentiment in zip(tickets, summaries, sentiments)
+        ]
+    
+    async def iter_ticket_insights(
+        self,
+        tickets: Iterable[Ticket],
+        chunk_size: int = INSIGHTS_CHUNK_SIZE
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream running ticket statistics, yielding after each chunk of tickets."""
+        # Count by status, priority and category keyed on the enum members,
+        # so counting skips the per-ticket .value lookups
+        status_members = Counter()
+        priority_members = Counter()
+        category_members = Counter()
+        total_tickets = 0
+        
+        iterator = iter(tickets)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            
+            # attrgetter + Counter.update keep the per-ticket work in C
+            status_members.update(map(_get_status, chunk))
+            priority_members.update(map(_get_priority, chunk))
+            category_members.update(map(_get_category, chunk))
+            total_tickets += len(chunk)
+            
+            # Translate the handful of distinct members to their string values
+            yield {
+                "analyzed_tickets": total_tickets,
+                "statistics": {
+                    "status_distribution": {STATUS_TO_STR[s]: n for s, n in status_members.items()},
+                    "priority_distribution": {PRIORITY_TO_STR[p]: n for p, n in priority_members.items()},
+                    "category_distribution": {CATEGORY_TO_STR[c]: n for c, n in category_members.items()}
+                }
+            }
+            
+            # Let other requests run between chunks of a large sweep
+            await asyncio.sleep(0)
+    
+    async def generate_ticket_insights(
+        self,
+        tickets: Iterable[Ticket],
+        include_text: bool = True
+    ) -> Optional[Dict[str, Any]]:
         """Generate insights from a collection of tickets using simple statistics."""
         try:
-            await self.initialize()
+            # Exhaust the stream; the last snapshot covers every ticket
+            snapshot = None
+            async for snapshot in self.iter_ticket_insights(tickets):
+                pass
             
-            if not tickets:
+            if snapshot is None:
                 return None
             
-            # Basic statistical analysis
-            total_tickets = len(tickets)
-            
-            # Count by status
-            status_counts = {}
-            for ticket in tickets:
-                status = ticket.status.value
-                status_counts[status] = status_counts.get(status, 0) + 1
+            total_tickets = snapshot["analyzed_tickets"]
+            statistics = snapshot["statistics"]
             
-            # Count by priority
-            priority_counts = {}
-            for ticket in tickets:
-                priority = ticket.priority.value
-                priority_counts[priority] = priority_counts.get(priority, 0) + 1
-            
-            # Count by category
-            category_counts = {}
-            for ticket in tickets:
-                category = ticket.category.value
-                category_counts[category] = category_counts.get(category, 0) + 1
-            
-            # Find most common issues
-            most_common_category = max(category_counts, key=category_counts.get)
-            most_common_priority = max(priority_counts, key=priority_counts.get)
-            
-            # Generate insights text
-            insights_text = f"""Analysis of {total_tickets} tickets:
-
-1. Common Themes:
-   - Most common category: {most_common_category} ({category_counts[most_common_category]} tickets)
-   - Most common priority: {most_common_priority} ({priority_counts[most_common_priority]} tickets)
-
-2. Status Distribution:
-   {', '.join([f'{status}: {count}' for status, count in status_counts.items()])}
-
-3. Priority Distribution:
-   {', '.join([f'{priority}: {count}' for priority, count in priority_counts.items()])}
-
-4. Category Distribution:
-   {', '.join([f'{category}: {count}' for category, count in category_counts.items()])}
-
-5. Recommendations:
-   - Focus on {most_common_category} issues for process improvement
-   - Consider dedicated resources for {most_common_priority} priority tickets
-   - Monitor trends in ticket volume and resolution times"""
+            insights_text = None
+            if include_text:
+                insights_text = _insights_text(
+                    total_tickets,
+                    statistics["status_distribution"],
+                    statistics["priority_distribution"],
+                    statistics["category_distribution"]
+                )
             
             return {
                 "insights": insights_text,
                 "analyzed_tickets": total_tickets,
                 "sample_size": total_tickets,
-                "generated_at": datetime.now().isoformat(),
-                "statistics": {
-                    "status_distribution": status_counts,
-                    "priority_distribution": priority_counts,
-                    "category_distribution": category_counts
-                }
+                "generated_at": _now_iso(),
+                "statistics": statistics
             }
             
         except Exception as e:
-            logger.error(f"Failed to generate ticket insights: {e}")
+            logger.error("Failed to generate ticket insights: %s", e)
             return None
 
 # Global instance
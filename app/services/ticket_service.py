@@ -2,24 +2,86 @@
 Ticket service for business logic and database operations.
 Follows Azure best practices for data access and business logic separation.
 """
+import asyncio
 import logging
 import json
+import time
+import orjson
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from sqlalchemy import create_engine, and_, or_
-from sqlalchemy.orm import sessionmaker, Session
+from typing import List, Optional, Dict, Any, Tuple, AsyncIterator
+from sqlalchemy import and_, or_, select, func, bindparam, case
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.exc import SQLAlchemyError
-from ..config import settings
+from ..config import get_settings
 from ..models.ticket import (
     TicketORM, Ticket, TicketCreate, TicketUpdate, TicketStatus, 
     TicketPriority, TicketCategory, TicketSearchRequest, TicketAnalytics,
-    Base
+    Base, STATUS_TO_STR, PRIORITY_TO_STR, CATEGORY_TO_STR
 )
 from .vector_store import vector_store
 from .rag_service import rag_service
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of tickets kept in the in-process read cache
+TICKET_CACHE_SIZE = 4096
+
+# Entries older than this are refetched, bounding staleness across workers
+TICKET_CACHE_TTL_SECONDS = 30.0
+
+# Plain column selects skip ORM identity-map hydration on list paths
+_TICKET_COLUMNS = tuple(TicketORM.__table__.c)
+
+# Tickets loaded per page when indexing existing rows at startup
+VECTOR_SYNC_BATCH_SIZE = 500
+
+# Compiled-statement cache entries kept per engine
+QUERY_CACHE_SIZE = 1200
+
+# Unfiltered "newest first" listing, built once and reused by list_recent
+_RECENT_TICKETS = select(*_TICKET_COLUMNS).order_by(TicketORM.created_at.desc())
+
+# Canonical lookups with named parameters, so each compiles to one cache entry
+# regardless of the ID or ID-list length
+_TICKETS_BY_IDS = select(TicketORM).where(TicketORM.id.in_(bindparam("ids", expanding=True)))
+_TICKET_EXISTS = select(TicketORM.id).where(TicketORM.id == bindparam("ticket_id"))
+
+# Sync drivers mapped onto the async driver for the same database
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "postgresql+psycopg": "postgresql+asyncpg"
+}
+_SUPPORTED_ASYNC_DRIVERS = frozenset(_ASYNC_DRIVERS.values())
+
+def _async_database_url(database_url: str) -> str:
+    """Map a database URL onto a supported async driver."""
+    url = make_url(database_url)
+    if url.drivername in _SUPPORTED_ASYNC_DRIVERS:
+        return database_url
+    async_driver = _ASYNC_DRIVERS.get(url.drivername)
+    if async_driver is None:
+        raise ValueError(
+            f"Unsupported database driver '{url.drivername}'; "
+            f"use one of: {', '.join(sorted(_SUPPORTED_ASYNC_DRIVERS))}"
+        )
+    return url.set(drivername=async_driver).render_as_string(hide_password=False)
+
+# Statuses counted as open / closed in analytics
+_OPEN_STATUSES = (TicketStatus.OPEN, TicketStatus.IN_PROGRESS, TicketStatus.PENDING)
+_CLOSED_STATUSES = (TicketStatus.RESOLVED, TicketStatus.CLOSED)
+
+def _resolution_hours(dialect_name: str):
+    """SQL expression for a ticket's resolution time in hours on the given dialect."""
+    if dialect_name == "postgresql":
+        return func.extract("epoch", TicketORM.resolved_at - TicketORM.created_at) / 3600
+    return (func.julianday(TicketORM.resolved_at) - func.julianday(TicketORM.created_at)) * 24
+
 class TicketService:
     """Service for ticket operations with integrated RAG capabilities."""
     
@@ -27,6 +89,7 @@ class TicketService:
         """Initialize the ticket service."""
         self.engine = None
         self.SessionLocal = None
+        self._ticket_cache: "OrderedDict[int, Tuple[Ticket, float]]" = OrderedDict()
         self._initialized = False
     
     async def initialize(self):
@@ -35,24 +98,32 @@ class TicketService:
             return
         
         try:
+            settings = get_settings()
+            
             # Create database engine
-            self.engine = create_engine(
-                settings.database_url,
+            self.engine = create_async_engine(
+                _async_database_url(settings.database_url),
                 echo=settings.debug,
                 pool_pre_ping=True,  # Verify connections before use
-                pool_recycle=3600    # Recycle connections every hour
+                pool_recycle=3600,   # Recycle connections every hour
+                query_cache_size=QUERY_CACHE_SIZE
             )
             
             # Create tables
-            Base.metadata.create_all(bind=self.engine)
+            async with self.engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
             
             # Create session factory
-            self.SessionLocal = sessionmaker(
-                autocommit=False,
+            self.SessionLocal = async_sessionmaker(
+                self.engine,
+                class_=AsyncSession,
                 autoflush=False,
-                bind=self.engine
+                expire_on_commit=False
             )
             
+            # Compile the hot statements once so the first requests hit the cache
+            await self._warm_query_cache()
+            
             # Initialize vector store
             await vector_store.initialize()
             
@@ -60,31 +131,98 @@ class TicketService:
             await rag_service.initialize()
             
             self._initialized = True
+            
+            # Index tickets persisted by earlier runs; opt-in, since it reads
+            # the whole table at boot
+            if settings.vector_sync_on_startup:
+                await self._sync_vector_store()
+            
             logger.info("Ticket service initialized successfully")
             
         except Exception as e:
             logger.error(f"Failed to initialize ticket service: {e}")
             raise
     
-    def get_db(self) -> Session:
+    async def _warm_query_cache(self):
+        """Execute the canonical selects once inside a rolled-back transaction."""
+        async with self.engine.connect() as conn:
+            await conn.execute(_RECENT_TICKETS.limit(1))
+            await conn.execute(_TICKETS_BY_IDS, {"ids": [0]})
+            await conn.execute(_TICKET_EXISTS, {"ticket_id": 0})
+            await conn.rollback()
+    
+    async def _sync_vector_store(self):
+        """Load existing tickets into the vector store in keyset-paginated batches."""
+        last_id = 0
+        total = 0
+        while True:
+            tickets = await self._select_tickets(
+                select(*_TICKET_COLUMNS)
+                .where(TicketORM.id > last_id)
+                .order_by(TicketORM.id)
+                .limit(VECTOR_SYNC_BATCH_SIZE)
+            )
+            if not tickets:
+                break
+            
+            total += await vector_store.add_tickets_batch(tickets)
+            last_id = tickets[-1].id
+        
+        logger.info(f"Indexed {total} existing tickets in the vector store")
+    
+    async def close(self):
+        """Dispose of the database engine and its pooled connections."""
+        if self.engine is not None:
+            await self.engine.dispose()
+        self._initialized = False
+    
+    async def healthcheck(self) -> Dict[str, Any]:
+        """Report service status without touching the database."""
+        return {"status": "healthy" if self._initialized else "not_initialized"}
+    
+    def _cache_ticket(self, ticket: Ticket):
+        """Store a ticket in the LRU read cache, evicting the least recent entry when full."""
+        cache = self._ticket_cache
+        cache[ticket.id] = (ticket, time.monotonic())
+        cache.move_to_end(ticket.id)
+        if len(cache) > TICKET_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    def get_ticket_cached_sync(self, ticket_id: int) -> Optional[Ticket]:
+        """Get a ticket from the read cache without awaiting, or None on a miss."""
+        ticket = self._fresh_cached_ticket(ticket_id)
+        if ticket is not None:
+            self._ticket_cache.move_to_end(ticket_id)
+        return ticket
+    
+    def _fresh_cached_ticket(self, ticket_id: int) -> Optional[Ticket]:
+        """Get a cached ticket still within its TTL, dropping it once expired."""
+        entry = self._ticket_cache.get(ticket_id)
+        if entry is None:
+            return None
+        
+        ticket, cached_at = entry
+        if time.monotonic() - cached_at > TICKET_CACHE_TTL_SECONDS:
+            del self._ticket_cache[ticket_id]
+            return None
+        
+        return ticket
+    
+    @asynccontextmanager
+    async def get_db(self) -> AsyncIterator[AsyncSession]:
         """Get database session with proper error handling."""
         if not self._initialized:
             raise RuntimeError("Service not initialized")
         
-        db = self.SessionLocal()
-        try:
-            return db
-        except Exception as e:
-            db.close()
-            raise
+        async with self.SessionLocal() as db:
+            yield db
     
     async def create_ticket(self, ticket_data: TicketCreate) -> Ticket:
         """Create a new ticket with vector store integration."""
         try:
             await self.initialize()
             
-            db = self.get_db()
-            try:
+            async with self.get_db() as db:
                 # Create ORM object
                 db_ticket = TicketORM(
                     title=ticket_data.title,
@@ -98,20 +236,19 @@ class TicketService:
                 
                 # Add to database
                 db.add(db_ticket)
-                db.commit()
-                db.refresh(db_ticket)
+                await db.commit()
+                await db.refresh(db_ticket)
                 
                 # Convert to Pydantic model
                 ticket = self._orm_to_pydantic(db_ticket)
-                
-                # Add to vector store asynchronously
-                await vector_store.add_ticket(ticket)
-                
-                logger.info(f"Created ticket {ticket.id}")
-                return ticket
-                
-            finally:
-                db.close()
+            
+            self._cache_ticket(ticket)
+            
+            # Add to vector store asynchronously
+            await vector_store.add_ticket(ticket)
+            
+            logger.info(f"Created ticket {ticket.id}")
+            return ticket
                 
         except SQLAlchemyError as e:
             logger.error(f"Database error creating ticket: {e}")
@@ -123,23 +260,65 @@ class TicketService:
     async def get_ticket(self, ticket_id: int) -> Optional[Ticket]:
         """Get a ticket by ID."""
         try:
+            cached = self.get_ticket_cached_sync(ticket_id)
+            if cached is not None:
+                return cached
+            
             await self.initialize()
             
-            db = self.get_db()
-            try:
-                db_ticket = db.query(TicketORM).filter(TicketORM.id == ticket_id).first()
+            async with self.get_db() as db:
+                db_ticket = await db.get(TicketORM, ticket_id)
                 if not db_ticket:
                     return None
                 
-                return self._orm_to_pydantic(db_ticket)
-                
-            finally:
-                db.close()
+                ticket = self._orm_to_pydantic(db_ticket)
+            
+            self._cache_ticket(ticket)
+            return ticket
                 
         except Exception as e:
             logger.error(f"Failed to get ticket {ticket_id}: {e}")
             raise
     
+    async def ticket_exists(self, ticket_id: int) -> bool:
+        """Check whether a ticket exists without loading it."""
+        try:
+            if self.get_ticket_cached_sync(ticket_id) is not None:
+                return True
+            
+            await self.initialize()
+            
+            async with self.get_db() as db:
+                result = await db.execute(_TICKET_EXISTS, {"ticket_id": ticket_id})
+                return result.first() is not None
+                
+        except Exception as e:
+            logger.error(f"Failed to check ticket {ticket_id}: {e}")
+            raise
+    
+    async def get_tickets_by_ids(self, ticket_ids: List[int]) -> Dict[int, Ticket]:
+        """Get several tickets in one query, keyed by ID."""
+        try:
+            await self.initialize()
+            
+            if not ticket_ids:
+                return {}
+            
+            tickets = await self._load_tickets_by_ids(ticket_ids)
+            for ticket in tickets.values():
+                self._cache_ticket(ticket)
+            return tickets
+                
+        except Exception as e:
+            logger.error(f"Failed to get tickets {ticket_ids}: {e}")
+            raise
+    
+    async def _load_tickets_by_ids(self, ticket_ids: List[int]) -> Dict[int, Ticket]:
+        """Load tickets with a single IN query."""
+        async with self.get_db() as db:
+            result = await db.execute(_TICKETS_BY_IDS, {"ids": ticket_ids})
+            return {ticket.id: self._orm_to_pydantic(ticket) for ticket in result.scalars().all()}
+    
     async def list_tickets(
         self,
         skip: int = 0,
@@ -154,42 +333,53 @@ class TicketService:
         try:
             await self.initialize()
             
-            db = self.get_db()
-            try:
-                query = db.query(TicketORM)
-                
-                # Apply filters
-                if status:
-                    query = query.filter(TicketORM.status.in_(status))
-                if priority:
-                    query = query.filter(TicketORM.priority.in_(priority))
-                if category:
-                    query = query.filter(TicketORM.category.in_(category))
-                if assignee:
-                    query = query.filter(TicketORM.assignee == assignee)
-                if reporter:
-                    query = query.filter(TicketORM.reporter == reporter)
-                
-                # Apply pagination and ordering
-                db_tickets = query.order_by(TicketORM.created_at.desc()).offset(skip).limit(limit).all()
-                
-                return [self._orm_to_pydantic(ticket) for ticket in db_tickets]
-                
-            finally:
-                db.close()
+            query = select(*_TICKET_COLUMNS)
+            
+            # Apply filters
+            if status:
+                query = query.where(TicketORM.status.in_(status))
+            if priority:
+                query = query.where(TicketORM.priority.in_(priority))
+            if category:
+                query = query.where(TicketORM.category.in_(category))
+            if assignee:
+                query = query.where(TicketORM.assignee == assignee)
+            if reporter:
+                query = query.where(TicketORM.reporter == reporter)
+            
+            # Apply pagination and ordering
+            query = query.order_by(TicketORM.created_at.desc()).offset(skip).limit(limit)
+            
+            return await self._select_tickets(query)
                 
         except Exception as e:
             logger.error(f"Failed to list tickets: {e}")
             raise
     
+    async def list_recent(self, limit: int = 100) -> List[Ticket]:
+        """List the newest tickets without any filtering."""
+        try:
+            await self.initialize()
+            
+            return await self._select_tickets(_RECENT_TICKETS.limit(limit))
+                
+        except Exception as e:
+            logger.error(f"Failed to list recent tickets: {e}")
+            raise
+    
+    async def _select_tickets(self, query) -> List[Ticket]:
+        """Run a ticket column select."""
+        async with self.get_db() as db:
+            result = await db.execute(query)
+            return [self._row_to_pydantic(row) for row in result.all()]
+    
     async def update_ticket(self, ticket_id: int, ticket_data: TicketUpdate) -> Optional[Ticket]:
         """Update a ticket with vector store synchronization."""
         try:
             await self.initialize()
             
-            db = self.get_db()
-            try:
-                db_ticket = db.query(TicketORM).filter(TicketORM.id == ticket_id).first()
+            async with self.get_db() as db:
+                db_ticket = await db.get(TicketORM, ticket_id)
                 if not db_ticket:
                     return None
                 
@@ -205,20 +395,22 @@ class TicketService:
                     if not db_ticket.resolved_at:
                         db_ticket.resolved_at = datetime.utcnow()
                 
-                db.commit()
-                db.refresh(db_ticket)
+                await db.commit()
+                await db.refresh(db_ticket)
+                
+                # Drop the old model so conversion cannot reuse it
+                self._ticket_cache.pop(ticket_id, None)
                 
                 # Convert to Pydantic model
                 ticket = self._orm_to_pydantic(db_ticket)
-                
-                # Update vector store
-                await vector_store.update_ticket(ticket)
-                
-                logger.info(f"Updated ticket {ticket_id}")
-                return ticket
-                
-            finally:
-                db.close()
+            
+            self._cache_ticket(ticket)
+            
+            # Update vector store
+            await vector_store.update_ticket(ticket)
+            
+            logger.info(f"Updated ticket {ticket_id}")
+            return ticket
                 
         except Exception as e:
             logger.error(f"Failed to update ticket {ticket_id}: {e}")
@@ -229,23 +421,21 @@ class TicketService:
         try:
             await self.initialize()
             
-            db = self.get_db()
-            try:
-                db_ticket = db.query(TicketORM).filter(TicketORM.id == ticket_id).first()
+            async with self.get_db() as db:
+                db_ticket = await db.get(TicketORM, ticket_id)
                 if not db_ticket:
                     return False
                 
-                db.delete(db_ticket)
-                db.commit()
-                
-                # Remove from vector store
-                await vector_store.remove_ticket(ticket_id)
-                
-                logger.info(f"Deleted ticket {ticket_id}")
-                return True
-                
-            finally:
-                db.close()
+                await db.delete(db_ticket)
+                await db.commit()
+            
+            self._ticket_cache.pop(ticket_id, None)
+            
+            # Remove from vector store
+            await vector_store.remove_ticket(ticket_id)
+            
+            logger.info(f"Deleted ticket {ticket_id}")
+            return True
                 
         except Exception as e:
             logger.error(f"Failed to delete ticket {ticket_id}: {e}")
@@ -262,19 +452,13 @@ class TicketService:
             search_results = await rag_service.search_tickets_with_context(search_request)
             ticket_ids = search_results.get("ticket_ids", [])
             
-            # Fetch full ticket data
+            # Fetch full ticket data, ranked by the database in search-result order
             tickets = []
             if ticket_ids:
-                db = self.get_db()
-                try:
-                    db_tickets = db.query(TicketORM).filter(TicketORM.id.in_(ticket_ids)).all()
-                    
-                    # Maintain order from search results
-                    ticket_map = {ticket.id: self._orm_to_pydantic(ticket) for ticket in db_tickets}
-                    tickets = [ticket_map[tid] for tid in ticket_ids if tid in ticket_map]
-                    
-                finally:
-                    db.close()
+                rank = case({tid: position for position, tid in enumerate(ticket_ids)}, value=TicketORM.id)
+                tickets = await self._select_tickets(
+                    select(*_TICKET_COLUMNS).where(TicketORM.id.in_(ticket_ids)).order_by(rank)
+                )
             
             search_time = (datetime.now() - start_time).total_seconds() * 1000
             
@@ -295,98 +479,104 @@ class TicketService:
         try:
             await self.initialize()
             
-            db = self.get_db()
-            try:
-                # Basic counts
-                total_tickets = db.query(TicketORM).count()
-                open_tickets = db.query(TicketORM).filter(
-                    TicketORM.status.in_([TicketStatus.OPEN, TicketStatus.IN_PROGRESS, TicketStatus.PENDING])
-                ).count()
-                closed_tickets = db.query(TicketORM).filter(
-                    TicketORM.status.in_([TicketStatus.RESOLVED, TicketStatus.CLOSED])
-                ).count()
-                
-                # Tickets by status
-                status_counts = {}
-                for status in TicketStatus:
-                    count = db.query(TicketORM).filter(TicketORM.status == status).count()
-                    status_counts[status.value] = count
-                
-                # Tickets by priority
-                priority_counts = {}
-                for priority in TicketPriority:
-                    count = db.query(TicketORM).filter(TicketORM.priority == priority).count()
-                    priority_counts[priority.value] = count
-                
-                # Tickets by category
-                category_counts = {}
-                for category in TicketCategory:
-                    count = db.query(TicketORM).filter(TicketORM.category == category).count()
-                    category_counts[category.value] = count
-                
-                # Calculate average resolution time
-                resolved_tickets = db.query(TicketORM).filter(
-                    and_(
-                        TicketORM.resolved_at.isnot(None),
-                        TicketORM.created_at.isnot(None)
-                    )
-                ).all()
-                
-                avg_resolution_time = None
-                if resolved_tickets:
-                    total_hours = sum([
-                        (ticket.resolved_at - ticket.created_at).total_seconds() / 3600
-                        for ticket in resolved_tickets
-                    ])
-                    avg_resolution_time = total_hours / len(resolved_tickets)
-                
-                # Recent activity (last 10 updates)
-                recent_tickets = db.query(TicketORM).order_by(
-                    TicketORM.updated_at.desc()
-                ).limit(10).all()
-                
-                recent_activity = []
-                for ticket in recent_tickets:
-                    activity = {
-                        "ticket_id": ticket.id,
-                        "title": ticket.title,
-                        "status": ticket.status.value,
-                        "updated_at": ticket.updated_at.isoformat() if ticket.updated_at else ticket.created_at.isoformat()
-                    }
-                    recent_activity.append(activity)
-                
-                return TicketAnalytics(
-                    total_tickets=total_tickets,
-                    open_tickets=open_tickets,
-                    closed_tickets=closed_tickets,
-                    avg_resolution_time_hours=avg_resolution_time,
-                    tickets_by_status=status_counts,
-                    tickets_by_priority=priority_counts,
-                    tickets_by_category=category_counts,
-                    recent_activity=recent_activity
-                )
-                
-            finally:
-                db.close()
+            async with self.get_db() as db:
+                return await self._build_analytics(db)
                 
         except Exception as e:
             logger.error(f"Failed to get ticket analytics: {e}")
             raise
     
+    async def _build_analytics(self, db: AsyncSession) -> TicketAnalytics:
+        """Run the analytics queries on an open session."""
+        # Tickets by status, priority and category, one grouped query each;
+        # enum members with no tickets still report zero
+        status_counts = {status.value: 0 for status in TicketStatus}
+        result = await db.execute(select(TicketORM.status, func.count()).group_by(TicketORM.status))
+        for status, count in result.all():
+            status_counts[STATUS_TO_STR[status]] = count
+        
+        priority_counts = {priority.value: 0 for priority in TicketPriority}
+        result = await db.execute(select(TicketORM.priority, func.count()).group_by(TicketORM.priority))
+        for priority, count in result.all():
+            priority_counts[PRIORITY_TO_STR[priority]] = count
+        
+        category_counts = {category.value: 0 for category in TicketCategory}
+        result = await db.execute(select(TicketORM.category, func.count()).group_by(TicketORM.category))
+        for category, count in result.all():
+            category_counts[CATEGORY_TO_STR[category]] = count
+        
+        # Basic counts derived from the status breakdown
+        total_tickets = sum(status_counts.values())
+        open_tickets = sum(status_counts[status.value] for status in _OPEN_STATUSES)
+        closed_tickets = sum(status_counts[status.value] for status in _CLOSED_STATUSES)
+        
+        # Calculate average resolution time in the database
+        avg_resolution_time = await db.scalar(
+            select(func.avg(_resolution_hours(self.engine.dialect.name))).where(
+                and_(
+                    TicketORM.resolved_at.isnot(None),
+                    TicketORM.created_at.isnot(None)
+                )
+            )
+        )
+        if avg_resolution_time is not None:
+            avg_resolution_time = float(avg_resolution_time)
+        
+        # Recent activity (last 10 updates)
+        result = await db.execute(select(TicketORM).order_by(
+            TicketORM.updated_at.desc()
+        ).limit(10))
+        recent_tickets = result.scalars().all()
+        
+        recent_activity = []
+        for ticket in recent_tickets:
+            activity = {
+                "ticket_id": ticket.id,
+                "title": ticket.title,
+                "status": STATUS_TO_STR[ticket.status],
+                "updated_at": ticket.updated_at.isoformat() if ticket.updated_at else ticket.created_at.isoformat()
+            }
+            recent_activity.append(activity)
+        
+        return TicketAnalytics(
+            total_tickets=total_tickets,
+            open_tickets=open_tickets,
+            closed_tickets=closed_tickets,
+            avg_resolution_time_hours=avg_resolution_time,
+            tickets_by_status=status_counts,
+            tickets_by_priority=priority_counts,
+            tickets_by_category=category_counts,
+            recent_activity=recent_activity
+        )
+    
     async def get_ticket_with_ai_insights(self, ticket_id: int) -> Optional[Dict[str, Any]]:
         """Get ticket with AI-generated insights."""
         try:
-            ticket = await self.get_ticket(ticket_id)
+            # Look up similar tickets by ID while the ticket itself loads
+            ticket, similar_tickets_data = await asyncio.gather(
+                self.get_ticket(ticket_id),
+                vector_store.get_similar_by_id(ticket_id, limit=5)
+            )
             if not ticket:
                 return None
             
-            # Generate AI insights
-            summary = await rag_service.generate_ticket_summary(ticket)
-            resolution_suggestion = await rag_service.suggest_resolution(ticket)
-            sentiment_analysis = await rag_service.analyze_ticket_sentiment(ticket)
+            # Generate AI insights concurrently; a failed part is reported as None
+            insights = await asyncio.gather(
+                rag_service.generate_ticket_summary(ticket),
+                rag_service.suggest_resolution(ticket),
+                rag_service.analyze_ticket_sentiment(ticket),
+                return_exceptions=True
+            )
+            for part in insights:
+                if isinstance(part, Exception):
+                    logger.error(f"AI insight generation failed for ticket {ticket_id}: {part}")
+            summary, resolution_suggestion, sentiment_analysis = [
+                None if isinstance(part, Exception) else part for part in insights
+            ]
             
-            # Find similar tickets
-            similar_tickets_data = await vector_store.get_similar_tickets(ticket, limit=5)
+            # Fall back to a text search when the ticket is not indexed yet
+            if similar_tickets_data is None:
+                similar_tickets_data = await vector_store.get_similar_tickets(ticket, limit=5)
             similar_ticket_ids = [tid for tid, score in similar_tickets_data if tid != ticket.id]
             
             return {
@@ -403,14 +593,39 @@ class TicketService:
             logger.error(f"Failed to get ticket with AI insights: {e}")
             raise
     
+    def _parse_tags(self, raw_tags: Optional[str]) -> List[str]:
+        """Decode the JSON tags column, treating bad data as no tags."""
+        if not raw_tags:
+            return []
+        try:
+            return orjson.loads(raw_tags)
+        except orjson.JSONDecodeError:
+            return []
+    
+    def _cached_model(self, ticket_id: int, updated_at: Optional[datetime]) -> Optional[Ticket]:
+        """Reuse a cached model that is within its TTL and matches the row's updated_at."""
+        ticket = self._fresh_cached_ticket(ticket_id)
+        if ticket is not None and ticket.updated_at == updated_at:
+            return ticket
+        return None
+    
+    def _row_to_pydantic(self, row) -> Ticket:
+        """Convert a Core result row to a Pydantic model without re-validation."""
+        cached = self._cached_model(row.id, row.updated_at)
+        if cached is not None:
+            return cached
+        
+        data = row._asdict()
+        data["tags"] = self._parse_tags(data["tags"])
+        return Ticket.model_construct(**data)
+    
     def _orm_to_pydantic(self, db_ticket: TicketORM) -> Ticket:
         """Convert SQLAlchemy ORM model to Pydantic model."""
-        tags = []
-        if db_ticket.tags:
-            try:
-                tags = json.loads(db_ticket.tags)
-            except json.JSONDecodeError:
-                tags = []
+        cached = self._cached_model(db_ticket.id, db_ticket.updated_at)
+        if cached is not None:
+            return cached
+        
+        tags = self._parse_tags(db_ticket.tags)
         
         return Ticket(
             id=db_ticket.id,
@@ -5,19 +5,45 @@ This is a simplified version that provides basic text search without external de
 import logging
 import json
 import asyncio
+import re
+import heapq
+from collections import Counter, OrderedDict, defaultdict
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
-from ..config import settings
-from ..models.ticket import Ticket
+from ..models.ticket import Ticket, STATUS_TO_STR, PRIORITY_TO_STR, CATEGORY_TO_STR
 
 logger = logging.getLogger(__name__)
 
+# Tokens indexed for search; a query term made only of word characters is a
+# substring of a field exactly when it is a substring of one of its tokens
+_TOKEN_RE = re.compile(r"\w+")
+
+# Joins fields into one buffer for a single lowercase pass; never present in ticket text
+_FIELD_SEP = "\x1f"
+
+# Per-term weights by the field a token appears in (best field wins)
+TITLE_WEIGHT = 3.0
+DESCRIPTION_WEIGHT = 2.0
+TAGS_WEIGHT = 2.0
+DOCUMENT_WEIGHT = 1.0
+
+# Maximum number of query results kept in the exact-match cache
+QUERY_CACHE_SIZE = 512
+
 class SimpleVectorStoreService:
     """Simple vector store service for basic text matching."""
     
     def __init__(self):
         """Initialize the simple vector store service."""
         self.tickets_store: Dict[int, Dict[str, Any]] = {}
+        # Inverted index: token -> {ticket_id: field weight}
+        self.postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        # Insertion sequence per ticket, used to break score ties in store order
+        self._next_seq = 0
+        # Exact query cache: key -> (store version, ticket_ids, scores)
+        self._query_cache: "OrderedDict[tuple, Tuple[int, List[int], List[float]]]" = OrderedDict()
+        # Bumped on every mutation so cached results go stale lazily
+        self._cache_version = 0
         self._initialized = False
         
     async def initialize(self):
@@ -27,6 +53,8 @@ class SimpleVectorStoreService:
         
         try:
             self.tickets_store = {}
+            self.postings = defaultdict(dict)
+            self._query_cache.clear()
             self._initialized = True
             logger.info("Simple vector store initialized successfully")
             
@@ -34,29 +62,16 @@ class SimpleVectorStoreService:
             logger.error(f"Failed to initialize vector store: {e}")
             raise
     
+    async def healthcheck(self) -> Dict[str, Any]:
+        """Report store status from in-memory state only."""
+        return {"status": "healthy" if self._initialized else "not_initialized"}
+    
     async def add_ticket(self, ticket: Ticket) -> bool:
         """Add a ticket to the vector store."""
         try:
             await self.initialize()
             
-            # Create document text for searching
-            document_text = self._create_document_text(ticket).lower()
-            
-            # Store ticket data with searchable text
-            self.tickets_store[ticket.id] = {
-                "ticket_id": ticket.id,
-                "document_text": document_text,
-                "title": ticket.title.lower(),
-                "description": ticket.description.lower(),
-                "status": ticket.status.value,
-                "priority": ticket.priority.value,
-                "category": ticket.category.value,
-                "assignee": ticket.assignee or "",
-                "reporter": ticket.reporter,
-                "created_at": ticket.created_at.isoformat(),
-                "updated_at": ticket.updated_at.isoformat() if ticket.updated_at else "",
-                "tags": " ".join(ticket.tags or []).lower()
-            }
+            self._index_ticket(ticket)
             
             logger.info(f"Added ticket {ticket.id} to simple vector store")
             return True
@@ -65,6 +80,76 @@ class SimpleVectorStoreService:
             logger.error(f"Failed to add ticket {ticket.id} to vector store: {e}")
             return False
     
+    async def add_tickets_batch(self, tickets: List[Ticket]) -> int:
+        """Add several tickets to the vector store, returning how many were indexed."""
+        await self.initialize()
+        
+        indexed = 0
+        for ticket in tickets:
+            try:
+                self._index_ticket(ticket)
+                indexed += 1
+            except Exception as e:
+                logger.error(f"Failed to add ticket {ticket.id} to vector store: {e}")
+        
+        logger.info(f"Added {indexed} tickets to simple vector store")
+        return indexed
+    
+    def _index_ticket(self, ticket: Ticket):
+        """Store a ticket's searchable text and update the inverted index."""
+        # Create document text for searching, lowercasing every field in one pass
+        raw_fields = (
+            ticket.title,
+            ticket.description,
+            " ".join(ticket.tags or []),
+            self._create_document_text(ticket)
+        )
+        fields = _FIELD_SEP.join(raw_fields).lower().split(_FIELD_SEP)
+        if len(fields) != len(raw_fields):
+            # A separator inside the text itself; fall back to per-field lowering
+            fields = [field.lower() for field in raw_fields]
+        title, description, tags, document_text = fields
+        
+        # Weight each token by the best field it appears in
+        token_weights = dict.fromkeys(_TOKEN_RE.findall(document_text), DOCUMENT_WEIGHT)
+        for field_text, weight in ((tags, TAGS_WEIGHT), (description, DESCRIPTION_WEIGHT), (title, TITLE_WEIGHT)):
+            for token in _TOKEN_RE.findall(field_text):
+                if token_weights.get(token, 0.0) < weight:
+                    token_weights[token] = weight
+        
+        # Re-adding a ticket replaces its previous postings
+        self._unindex(ticket.id)
+        self._cache_version += 1
+        for token, weight in token_weights.items():
+            self.postings[token][ticket.id] = weight
+        
+        # Re-added tickets keep their original position for tie-breaking
+        existing = self.tickets_store.get(ticket.id)
+        if existing is not None:
+            seq = existing["seq"]
+        else:
+            seq = self._next_seq
+            self._next_seq += 1
+        
+        # Store ticket data with searchable text
+        self.tickets_store[ticket.id] = {
+            "ticket_id": ticket.id,
+            "seq": seq,
+            "document_text": document_text,
+            "title": title,
+            "description": description,
+            "status": STATUS_TO_STR[ticket.status],
+            "priority": PRIORITY_TO_STR[ticket.priority],
+            "category": CATEGORY_TO_STR[ticket.category],
+            "assignee": ticket.assignee or "",
+            "reporter": ticket.reporter,
+            "tags": tags,
+            "tokens": tuple(token_weights),
+            # Title and description in one buffer so the phrase bonus needs a single find
+            "phrase_text": title + _FIELD_SEP + description,
+            "title_end": len(title)
+        }
+    
     async def update_ticket(self, ticket: Ticket) -> bool:
         """Update a ticket in the vector store."""
         try:
@@ -83,6 +168,8 @@ class SimpleVectorStoreService:
             await self.initialize()
             
             if ticket_id in self.tickets_store:
+                self._unindex(ticket_id)
+                self._cache_version += 1
                 del self.tickets_store[ticket_id]
                 logger.info(f"Removed ticket {ticket_id} from vector store")
             
@@ -92,91 +179,145 @@ class SimpleVectorStoreService:
             logger.error(f"Failed to remove ticket {ticket_id} from vector store: {e}")
             return False
     
+    def _unindex(self, ticket_id: int):
+        """Drop a ticket's postings from the inverted index."""
+        ticket_data = self.tickets_store.get(ticket_id)
+        if ticket_data is None:
+            return
+        
+        for token in ticket_data["tokens"]:
+            posting = self.postings.get(token)
+            if posting is None:
+                continue
+            posting.pop(ticket_id, None)
+            if not posting:
+                del self.postings[token]
+    
+    def _filters_key(self, filters: Optional[Dict[str, Any]]) -> Optional[tuple]:
+        """Hashable, order-independent form of a search filter dict."""
+        if not filters:
+            return None
+        return tuple(sorted(
+            (key, tuple(value) if isinstance(value, list) else value)
+            for key, value in filters.items()
+        ))
+    
+    def _term_weights(self, term: str) -> Dict[int, float]:
+        """Best field weight per ticket whose fields contain term as a substring."""
+        weights: Dict[int, float] = {}
+        
+        if _TOKEN_RE.fullmatch(term):
+            # Expand the term to every indexed token containing it
+            for token, posting in self.postings.items():
+                if term in token:
+                    for ticket_id, weight in posting.items():
+                        if weights.get(ticket_id, 0.0) < weight:
+                            weights[ticket_id] = weight
+            return weights
+        
+        # Terms with punctuation can span tokens, so check the stored fields directly
+        for ticket_id, ticket_data in self.tickets_store.items():
+            if term in ticket_data["title"]:
+                weights[ticket_id] = TITLE_WEIGHT
+            elif term in ticket_data["description"]:
+                weights[ticket_id] = DESCRIPTION_WEIGHT
+            elif term in ticket_data["tags"]:
+                weights[ticket_id] = TAGS_WEIGHT
+            elif term in ticket_data["document_text"]:
+                weights[ticket_id] = DOCUMENT_WEIGHT
+        return weights
+    
     async def search_tickets(
         self, 
         query: str, 
         limit: int = 10,
         filters: Optional[Dict[str, Any]] = None
-    ) -> List[Tuple[int, float]]:
+    ) -> Tuple[List[int], List[float]]:
         """
         Search for tickets using simple text matching.
         
         Returns:
-            List of tuples (ticket_id, similarity_score)
+            Parallel lists (ticket_ids, similarity_scores), best match first
         """
         try:
             await self.initialize()
             
             query_lower = query.lower()
+            
+            # Serve repeated queries from the cache while the store is unchanged
+            cache_key = (query_lower, limit, self._filters_key(filters))
+            cached = self._query_cache.get(cache_key)
+            if cached is not None and cached[0] == self._cache_version:
+                self._query_cache.move_to_end(cache_key)
+                return list(cached[1]), list(cached[2])
+            
             query_terms = query_lower.split()
             
             results = []
             
-            for ticket_id, ticket_data in self.tickets_store.items():
-                # Apply filters if provided
-                if filters:
-                    skip_ticket = False
-                    for key, value in filters.items():
-                        if value is not None:
-                            if isinstance(value, list):
-                                if ticket_data.get(key) not in value:
-                                    skip_ticket = True
-                                    break
-                            else:
-                                if ticket_data.get(key) != value:
-                                    skip_ticket = True
-                                    break
-                    
-                    if skip_ticket:
-                        continue
-                
-                # Calculate simple text similarity
-                document_text = ticket_data["document_text"]
-                title = ticket_data["title"]
-                description = ticket_data["description"]
-                tags = ticket_data["tags"]
+            # Resolve filters once per query: list values become sets, scalars single-item sets
+            conditions = [
+                (key, frozenset(value) if isinstance(value, list) else frozenset((value,)))
+                for key, value in (filters or {}).items()
+                if value is not None
+            ]
+            
+            # Sum each term's field weight over the tickets that contain it
+            term_scores = Counter()
+            for term in query_terms:
+                term_scores.update(self._term_weights(term))
+            
+            # Without terms only the phrase bonus can score, so every ticket is a candidate
+            if not query_terms:
+                term_scores = dict.fromkeys(self.tickets_store, 0.0)
+            
+            max_score = len(query_terms) * TITLE_WEIGHT or 1.0  # Max possible score is 3.0 per term
+            
+            # A separator in the query could match across the title/description boundary
+            single_find = _FIELD_SEP not in query_lower
+            
+            for ticket_id, term_score in term_scores.items():
+                ticket_data = self.tickets_store[ticket_id]
                 
-                # Count matching terms
-                score = 0.0
-                total_terms = len(query_terms)
+                # Filter candidates before the phrase checks
+                if conditions and not all(ticket_data.get(key) in allowed for key, allowed in conditions):
+                    continue
                 
-                if total_terms > 0:
-                    for term in query_terms:
-                        # Title matches get higher weight
-                        if term in title:
-                            score += 3.0
-                        # Description matches get medium weight
-                        elif term in description:
-                            score += 2.0
-                        # Tag matches get medium weight
-                        elif term in tags:
-                            score += 2.0
-                        # General document matches get lower weight
-                        elif term in document_text:
-                            score += 1.0
-                    
-                    # Normalize score (0-1 range)
-                    score = score / (total_terms * 3.0)  # Max possible score is 3.0 per term
+                # Normalize score (0-1 range)
+                score = term_score / max_score
                 
-                # Also check for exact phrase matches (higher score)
-                if query_lower in title:
+                # Also check for exact phrase matches (higher score); the first hit
+                # lands in the title whenever the title contains the phrase
+                if single_find:
+                    position = ticket_data["phrase_text"].find(query_lower)
+                    if position != -1:
+                        score += 0.5 if position < ticket_data["title_end"] else 0.3
+                elif query_lower in ticket_data["title"]:
                     score += 0.5
-                elif query_lower in description:
+                elif query_lower in ticket_data["description"]:
                     score += 0.3
                 
                 if score > 0:
-                    results.append((ticket_id, min(score, 1.0)))  # Cap at 1.0
+                    results.append((ticket_id, min(score, 1.0), ticket_data["seq"]))  # Cap at 1.0
+            
+            # Select the top results by score without sorting every candidate; ties
+            # keep store order, as the stable full sort did
+            results = heapq.nlargest(limit, results, key=lambda r: (r[1], -r[2]))
             
-            # Sort by score descending and limit results
-            results.sort(key=lambda x: x[1], reverse=True)
-            results = results[:limit]
+            ticket_ids = [ticket_id for ticket_id, _, _ in results]
+            scores = [score for _, score, _ in results]
             
-            logger.info(f"Found {len(results)} tickets for query: {query}")
-            return results
+            self._query_cache[cache_key] = (self._cache_version, ticket_ids, scores)
+            self._query_cache.move_to_end(cache_key)
+            if len(self._query_cache) > QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+            
+            logger.info(f"Found {len(ticket_ids)} tickets for query: {query}")
+            return list(ticket_ids), list(scores)
             
         except Exception as e:
             logger.error(f"Failed to search tickets: {e}")
-            return []
+            return [], []
     
     async def get_similar_tickets(
         self, 
@@ -187,24 +328,46 @@ class SimpleVectorStoreService:
         try:
             # Use title and description as search query
             search_query = f"{ticket.title} {ticket.description}"
-            results = await self.search_tickets(search_query, limit + 1)  # +1 to exclude self
+            ticket_ids, scores = await self.search_tickets(search_query, limit + 1)  # +1 to exclude self
             
             # Filter out the original ticket
-            filtered_results = [(tid, score) for tid, score in results if tid != ticket.id]
+            filtered_results = [(tid, score) for tid, score in zip(ticket_ids, scores) if tid != ticket.id]
             return filtered_results[:limit]
             
         except Exception as e:
             logger.error(f"Failed to find similar tickets for {ticket.id}: {e}")
             return []
     
+    async def get_similar_by_id(
+        self, 
+        ticket_id: int, 
+        limit: int = 5
+    ) -> Optional[List[Tuple[int, float]]]:
+        """Find tickets similar to an indexed ticket, or None if it is not indexed."""
+        try:
+            ticket_data = self.tickets_store.get(ticket_id)
+            if ticket_data is None:
+                return None
+            
+            # Stored title/description are already lowercased, matching the search query path
+            search_query = f"{ticket_data['title']} {ticket_data['description']}"
+            ticket_ids, scores = await self.search_tickets(search_query, limit + 1)  # +1 to exclude self
+            
+            filtered_results = [(tid, score) for tid, score in zip(ticket_ids, scores) if tid != ticket_id]
+            return filtered_results[:limit]
+            
+        except Exception as e:
+            logger.error(f"Failed to find similar tickets for {ticket_id}: {e}")
+            return []
+    
     def _create_document_text(self, ticket: Ticket) -> str:
         """Create a text representation of the ticket for searching."""
         text_parts = [
             f"Title: {ticket.title}",
             f"Description: {ticket.description}",
-            f"Status: {ticket.status.value}",
-            f"Priority: {ticket.priority.value}",
-            f"Category: {ticket.category.value}",
+            f"Status: {STATUS_TO_STR[ticket.status]}",
+            f"Priority: {PRIORITY_TO_STR[ticket.priority]}",
+            f"Category: {CATEGORY_TO_STR[ticket.category]}",
             f"Reporter: {ticket.reporter}"
         ]
         
@@ -238,6 +401,9 @@ class SimpleVectorStoreService:
         """Reset the entire collection (use with caution)."""
         try:
             self.tickets_store = {}
+            self.postings = defaultdict(dict)
+            self._query_cache.clear()
+            self._cache_version += 1
             logger.warning("Vector collection has been reset")
             return True
             